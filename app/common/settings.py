@@ -0,0 +1,181 @@
+#app/common/settings.py
+
+import json
+import logging
+import os
+import platform
+from typing import Any, Dict, Optional
+
+from utils.file_utils import get_app_directory
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SETTINGS_FILE = "settings.json"
+CALIBRATION_FILE = "calibration.json"
+
+# Defaults for every tunable; settings.json in the app directory only needs the overrides
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    # 'auto': record at 16 kHz if the device supports it, otherwise resample while recording
+    # 'resample': always record at the device rate and resample while recording
+    # 'device': record at the device rate and resample after recording stops
+    'capture_mode': 'auto',
+    # Recordings larger than this many MB move from RAM to a memory-mapped file
+    'spill_threshold_mb': 64,
+    # Clips longer than this many seconds are decoded in separate windows
+    'decode_window_seconds': 600,
+    # Run the Whisper model in a separate process that is terminated to unload it
+    'inference_worker': False,
+    # Number of decodes run at the same time, streaming and chunked passes included
+    'transcription_workers': 1,
+    # Finished recordings allowed to wait for a free worker
+    'transcription_queue_size': 2,
+    # When the queue is full: 'backpressure' refuses to start a new recording,
+    # 'drop_oldest' drops the oldest waiting clip, 'reject' drops the new clip
+    'transcription_queue_policy': 'backpressure',
+    # Keep the microphone stream open between recordings so starting is instant
+    'keep_stream_warm': False,
+    # Milliseconds of audio from before the key press kept when the stream is warm
+    'preroll_ms': 300,
+    # Seconds of audio the capture queue holds while the consumer thread is busy
+    'capture_queue_seconds': 5.0,
+    # 'batch' decodes after recording stops, 'streaming' re-decodes a sliding window
+    # while recording, 'chunked' decodes each utterance when the speaker pauses
+    'transcription_mode': 'batch',
+    # Seconds between background passes in streaming mode
+    'streaming_interval': 2.0,
+    # Silence in seconds that ends an utterance in chunked mode
+    'pause_commit_seconds': 0.7,
+    # Level in dBFS below which audio is never treated as speech
+    'vad_threshold_db': -45.0,
+    # Recordings shorter than this many seconds are treated as accidental taps
+    'min_recording_seconds': 0.3,
+    # Recordings whose loudest sample stays below this level in dBFS are treated as silent
+    'silence_peak_db': -35.0,
+    # Recordings with a smaller share of voiced frames are treated as silent
+    'min_voiced_ratio': 0.02,
+    # Milliseconds of audio kept around speech when trimming silent edges
+    'trim_guard_ms': 250,
+    # Stop recording automatically once the speaker goes quiet
+    'auto_stop': False,
+    # Trailing silence in milliseconds that ends a recording when auto_stop is on
+    'auto_stop_silence_ms': 1500,
+    # Hard limit in seconds for a recording when auto_stop is on
+    'auto_stop_max_seconds': 300,
+    # Start loading the model and opening the microphone as soon as Cmd+Shift is held
+    'predictive_warmup': False,
+    # Milliseconds to wait for the 9 key before a predictively opened stream is closed
+    'predictive_warmup_window_ms': 1500,
+    # Memory in MB that loaded models may use together; least recently used ones are unloaded
+    'model_memory_budget_mb': 2048,
+    # Seconds a model may sit unused before it is unloaded
+    'model_idle_timeout_seconds': 600,
+    # Idle timeouts for individual models, e.g. {"large": 120}
+    'model_idle_timeouts': {},
+    # Stretch idle timeouts (up to model_idle_timeout_max_seconds) when uses tend
+    # to come back just after the timeout, e.g. during bursts of dictation
+    'adaptive_idle_timeout': True,
+    'model_idle_timeout_max_seconds': 2400,
+    # Run a short synthetic decode in the background after each model load
+    'model_warmup': True,
+    # Decode profile (see app/core/decode_profiles.py): 'fast' decodes greedily without
+    # timestamps, 'accurate' uses beam search with word timestamps
+    'decode_profile': 'fast',
+    # Further Cmd+Shift+<key> chords that record with another decode profile
+    'hotkey_profiles': {'0': 'accurate'},
+    # Language code such as "en" passed to every decode; null detects it per clip
+    'language': None,
+    # Without a configured language, pin the detected one after language_lock_after
+    # detections in a row at language_lock_min_probability or more. The pinned language
+    # is detected again every language_recheck_every decodes, and whenever a decode's
+    # average log probability drops below language_unlock_logprob. Off by default:
+    # Whisper forced into the wrong language may translate instead of transcribing
+    'language_lock': False,
+    'language_lock_after': 3,
+    'language_lock_min_probability': 0.9,
+    'language_unlock_logprob': -1.0,
+    'language_recheck_every': 10,
+    # Larger model, e.g. "large-v3-turbo", that re-decodes the parts of a batch
+    # transcription the active model is unsure about; null disables the cascade
+    'cascade_model': None,
+    # Segments below this average log probability, above this compression ratio
+    # or above this no-speech probability count as unsure
+    'cascade_min_logprob': -1.0,
+    'cascade_max_compression_ratio': 2.4,
+    'cascade_max_no_speech_prob': 0.6,
+    # Seconds of context re-decoded around an unsure span
+    'cascade_span_padding_seconds': 0.5,
+    # Share of a clip above which the whole clip is re-decoded
+    'cascade_whole_clip_fraction': 0.5,
+}
+
+def load_settings() -> Dict[str, Any]:
+    """
+    Load user settings merged over the defaults.
+
+    Returns:
+        Dictionary with a value for every key in DEFAULT_SETTINGS
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    settings_path = get_app_directory() / SETTINGS_FILE
+
+    try:
+        if settings_path.exists():
+            with open(settings_path) as f:
+                overrides = json.load(f)
+            for key, value in overrides.items():
+                if key in DEFAULT_SETTINGS:
+                    settings[key] = value
+                else:
+                    logger.warning(f"Ignoring unknown setting: {key}")
+    except Exception as e:
+        logger.error(f"Error reading {settings_path}, using defaults: {e}")
+
+    return settings
+
+def machine_signature() -> Dict[str, Any]:
+    """Describe this computer's CPU, so a calibration copied from another machine is ignored."""
+    return {
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def save_calibration(calibration: Dict[str, Any]) -> None:
+    """
+    Save the result of a model load calibration to the app directory.
+
+    Args:
+        calibration: Dictionary with at least compute_type, cpu_threads and num_workers
+    """
+    calibration_path = get_app_directory() / CALIBRATION_FILE
+    calibration = dict(calibration, machine=machine_signature())
+    try:
+        with open(calibration_path, 'w') as f:
+            json.dump(calibration, f, indent=2)
+        logger.info(f"Saved calibration to {calibration_path}")
+    except Exception as e:
+        logger.error(f"Error writing {calibration_path}: {e}")
+
+def load_calibration() -> Optional[Dict[str, Any]]:
+    """
+    Load the calibrated WhisperModel options for this computer.
+
+    Returns:
+        Keyword arguments (compute_type, cpu_threads, num_workers) for WhisperModel,
+        or None if no calibration was made on this computer
+    """
+    calibration_path = get_app_directory() / CALIBRATION_FILE
+    if not calibration_path.exists():
+        return None
+
+    try:
+        with open(calibration_path) as f:
+            calibration = json.load(f)
+        if calibration.get('machine') != machine_signature():
+            logger.warning(f"Ignoring {calibration_path}, it was made on a different computer")
+            return None
+        return {key: calibration[key] for key in ('compute_type', 'cpu_threads', 'num_workers')}
+    except Exception as e:
+        logger.error(f"Error reading {calibration_path}, using default model settings: {e}")
+        return None
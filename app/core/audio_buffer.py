@@ -0,0 +1,340 @@
+#app/core/audio_buffer.py
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+import numpy as np
+
+from app.core.shared_audio import AudioHandle, create_segment, release_segment
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SPILL_PREFIX = "recording-"
+SPILL_SUFFIX = ".raw"
+
+def cleanup_spill_files(directory: Path) -> int:
+    """
+    Delete spill files left behind by a previous run that did not exit cleanly.
+
+    Args:
+        directory: Directory spill files are written to
+    
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    for path in Path(directory).glob(f"{SPILL_PREFIX}*{SPILL_SUFFIX}"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.error(f"Error removing stale spill file {path}: {e}")
+    if removed:
+        logger.info(f"Removed {removed} stale recording spill file(s)")
+    return removed
+
+class AudioBuffer:
+    """Contiguous capture buffer that grows in large chunks.
+
+    Once the buffer would exceed `spill_bytes` its storage moves to a
+    memory-mapped file, so very long recordings are paged by the OS instead of
+    being held in RAM. With `shared` set the in-RAM storage is a shared memory
+    segment, so another process can read the recording through handle().
+    The buffer owns the segment: it is unlinked by close(), after the other
+    process has finished with it.
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1, dtype=np.int16,
+                 chunk_seconds: float = 60.0, max_seconds: Optional[float] = None,
+                 spill_bytes: Optional[int] = None, spill_dir: Optional[Path] = None,
+                 shared: bool = False):
+        """
+        Initialize the capture buffer.
+
+        Args:
+            sample_rate: Sample rate of the audio written to the buffer
+            channels: Number of audio channels
+            dtype: Sample type of the stored audio
+            chunk_seconds: Amount of audio to allocate each time the buffer grows
+            max_seconds: Optional hard limit; when set the whole duration is preallocated
+            spill_bytes: Size above which storage moves to a memory-mapped file, None to never spill
+            spill_dir: Directory for the memory-mapped file
+            shared: Keep in-RAM storage in shared memory instead of private memory
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.chunk_frames = max(1, int(chunk_seconds * sample_rate))
+        self.max_frames = int(max_seconds * sample_rate) if max_seconds else None
+
+        self.frame_bytes = self.dtype.itemsize * channels
+        self.spill_bytes = spill_bytes
+        self.spill_dir = spill_dir
+        self.spill_path: Optional[str] = None
+        self.shared = shared
+        self._segment = None
+        self._length = 0
+        self.dropped_frames = 0
+
+        initial_frames = self.max_frames if self.max_frames else self.chunk_frames
+        if self._should_spill(initial_frames):
+            self._data = self._map_file(initial_frames)
+        else:
+            self._data = self._allocate(initial_frames)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        """Number of frames the buffer can hold without growing."""
+        return self._data.shape[0]
+
+    @property
+    def duration(self) -> float:
+        """Duration of the stored audio in seconds."""
+        return self._length / self.sample_rate
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the audio lives in a memory-mapped file."""
+        return self.spill_path is not None
+
+    def _should_spill(self, frames: int) -> bool:
+        """Whether storage for `frames` frames belongs on disk."""
+        return (self.spill_bytes is not None and self.spill_dir is not None
+                and frames * self.frame_bytes > self.spill_bytes)
+
+    def _allocate(self, frames: int) -> np.ndarray:
+        """Allocate in-RAM storage for `frames` frames, in a new shared segment if requested."""
+        if not self.shared:
+            # np.empty only reserves address space; pages are committed as they are written
+            return np.empty((frames, self.channels), dtype=self.dtype)
+        self._segment = create_segment(frames * self.frame_bytes)
+        # frombuffer keeps the segment's buffer exported while any view is alive,
+        # so unmapping it under a live view fails instead of crashing
+        data = np.frombuffer(self._segment.buf, dtype=self.dtype, count=frames * self.channels)
+        return data.reshape(frames, self.channels)
+
+    def _map_file(self, frames: int) -> np.ndarray:
+        """Create or extend the spill file to hold `frames` frames and map it."""
+        if self.spill_path is None:
+            fd, self.spill_path = tempfile.mkstemp(prefix=SPILL_PREFIX, suffix=SPILL_SUFFIX, dir=self.spill_dir)
+            os.close(fd)
+            logger.info(f"Recording exceeded {self.spill_bytes / 1e6:.0f}MB, spilling to {self.spill_path}")
+        with open(self.spill_path, 'r+b') as f:
+            f.truncate(frames * self.frame_bytes)
+        return np.memmap(self.spill_path, dtype=self.dtype, mode='r+', shape=(frames, self.channels))
+
+    def _grow(self, required: int) -> None:
+        """Grow the storage by whole chunks so that it can hold `required` frames."""
+        chunks = -(-(required - self.capacity) // self.chunk_frames)
+        new_capacity = self.capacity + chunks * self.chunk_frames
+        logger.debug(f"Growing audio buffer to {new_capacity / self.sample_rate:.0f}s")
+
+        if self.is_spilled:
+            # Extending the file keeps existing samples in place, nothing is copied
+            self._data = self._map_file(new_capacity)
+            return
+
+        old_segment = self._segment
+        if self._should_spill(new_capacity):
+            new_data = self._map_file(new_capacity)
+            self._segment = None
+        else:
+            new_data = self._allocate(new_capacity)
+        new_data[:self._length] = self._data[:self._length]
+        self._data = new_data
+        if old_segment is not None:
+            # Unlinked now, unmapped once no views of the old storage remain
+            release_segment(old_segment)
+
+    def write(self, block: np.ndarray) -> int:
+        """
+        Append a block of audio to the buffer.
+
+        Args:
+            block: Audio block shaped (frames, channels)
+
+        Returns:
+            Number of frames actually stored
+        """
+        frames = block.shape[0]
+        required = self._length + frames
+
+        if self.max_frames is not None and required > self.max_frames:
+            # Preallocated buffers never grow; drop what does not fit
+            frames = max(0, self.max_frames - self._length)
+            self.dropped_frames += block.shape[0] - frames
+            required = self._length + frames
+        elif required > self.capacity:
+            self._grow(required)
+
+        if frames:
+            self._data[self._length:required] = block[:frames]
+            self._length = required
+        return frames
+
+    def view(self) -> np.ndarray:
+        """Return a zero-copy view of the recorded audio."""
+        # Read the length first: if the writer is growing the storage meanwhile,
+        # the new length must never be applied to the old, shorter array
+        length = self._length
+        return self._data[:length]
+
+    def handle(self, view: np.ndarray) -> Optional[AudioHandle]:
+        """
+        Describe a view of this buffer so another process can map it without copying.
+
+        Args:
+            view: Contiguous slice of the array returned by view()
+
+        Returns:
+            Handle to the slice, or None if the storage is private memory
+            or the view does not belong to the current storage
+        """
+        if self.is_spilled:
+            kind, name = 'file', self.spill_path
+        elif self._segment is not None:
+            kind, name = 'shm', self._segment.name
+        else:
+            return None
+
+        offset = view.__array_interface__['data'][0] - self._data.__array_interface__['data'][0]
+        start, remainder = divmod(offset, self.frame_bytes)
+        if (remainder or start < 0 or start + len(view) > self._length
+                or view.ndim != 2 or view.strides != self._data.strides):
+            return None
+        return AudioHandle(kind, name, self.dtype.str, self._data.shape,
+                           int(start), int(start + len(view)), self.sample_rate)
+
+    def close(self) -> None:
+        """Release the storage and delete the spill file or shared segment, if any."""
+        self._data = np.empty((0, self.channels), dtype=self.dtype)
+        self._length = 0
+        if self._segment is not None:
+            release_segment(self._segment)
+            self._segment = None
+        if self.spill_path is not None:
+            # Existing views keep their mapping after the file is unlinked
+            try:
+                os.remove(self.spill_path)
+            except OSError as e:
+                logger.error(f"Error removing spill file {self.spill_path}: {e}")
+            self.spill_path = None
+
+class BlockQueue:
+    """Single-producer/single-consumer queue of audio blocks in a preallocated array.
+
+    The producer (the PortAudio callback) only copies into a free slot and
+    advances the write counter; the consumer only reads a slot and advances the
+    read counter. Each counter has a single writer, so no lock is needed.
+    """
+
+    def __init__(self, slots: int, blocksize: int, channels: int = 1, dtype=np.int16):
+        """
+        Initialize the queue.
+
+        Args:
+            slots: Number of blocks the queue can hold before it overflows
+            blocksize: Maximum frames per block
+            channels: Number of audio channels
+            dtype: Sample type of the blocks
+        """
+        self.slots = slots
+        self.blocksize = blocksize
+        self._blocks = np.zeros((slots, blocksize, channels), dtype=dtype)
+        self._lengths = np.zeros(slots, dtype=np.int64)
+        self._write = 0  # Only advanced by the producer
+        self._read = 0   # Only advanced by the consumer
+        self.overflows = 0
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    @property
+    def written(self) -> int:
+        """Total number of blocks the producer has queued."""
+        return self._write
+
+    @property
+    def consumed(self) -> int:
+        """Total number of blocks the consumer has released."""
+        return self._read
+
+    def put(self, block: np.ndarray) -> bool:
+        """
+        Copy a block into the next free slot without allocating.
+
+        Args:
+            block: Audio block shaped (frames, channels)
+
+        Returns:
+            False if the queue was full and the block was dropped
+        """
+        if self._write - self._read >= self.slots:
+            self.overflows += 1
+            return False
+        slot = self._write % self.slots
+        frames = min(block.shape[0], self.blocksize)
+        self._blocks[slot, :frames] = block[:frames]
+        self._lengths[slot] = frames
+        # Publish only after the copy is complete
+        self._write += 1
+        return True
+
+    def peek(self) -> Optional[np.ndarray]:
+        """
+        Return a view of the oldest block, or None if the queue is empty.
+
+        The view stays valid until release() is called.
+        """
+        if self._read == self._write:
+            return None
+        slot = self._read % self.slots
+        return self._blocks[slot, :self._lengths[slot]]
+
+    def release(self) -> None:
+        """Hand the oldest block's slot back to the producer."""
+        self._read += 1
+
+class PreRollBuffer:
+    """Fixed-size ring that always holds the most recent audio."""
+
+    def __init__(self, frames: int, channels: int = 1, dtype=np.int16):
+        """
+        Initialize the ring.
+
+        Args:
+            frames: Number of most recent frames to keep
+            channels: Number of audio channels
+            dtype: Sample type of the stored audio
+        """
+        self._data = np.zeros((max(1, frames), channels), dtype=dtype)
+        self._pos = 0
+        self._filled = 0
+
+    def write(self, block: np.ndarray) -> None:
+        """Append a block, overwriting the oldest audio."""
+        capacity = self._data.shape[0]
+        block = block[-capacity:]
+        frames = block.shape[0]
+        first = min(frames, capacity - self._pos)
+        self._data[self._pos:self._pos + first] = block[:first]
+        self._data[:frames - first] = block[first:]
+        self._pos = (self._pos + frames) % capacity
+        self._filled = min(capacity, self._filled + frames)
+
+    def snapshot(self) -> np.ndarray:
+        """Return a copy of the stored audio, oldest frame first."""
+        if self._filled < self._data.shape[0]:
+            return self._data[self._pos - self._filled:self._pos].copy()
+        return np.concatenate((self._data[self._pos:], self._data[:self._pos]))
+
+    def clear(self) -> None:
+        """Forget the stored audio."""
+        self._pos = 0
+        self._filled = 0
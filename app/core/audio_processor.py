@@ -1,11 +1,12 @@
 #app/core/audio_processor.py
 
-from typing import Optional, Set, List
-import os
+from typing import Optional, Set
 import time
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from threading import Thread
+from functools import partial
+from threading import Event, Lock, Thread, Timer
 import logging
 import numpy as np
 import sounddevice as sd
@@ -22,6 +23,21 @@ import sys
 
 from app.models.model_manager import ModelManager
 from app.core.text_processor import process_text
+from app.core.audio_buffer import AudioBuffer, BlockQueue, PreRollBuffer, cleanup_spill_files
+from app.core.cascade import ModelCascade
+from app.core.decode_profiles import profile_options
+from app.core.dsp import (WHISPER_SAMPLE_RATE, StreamingResampler, prepare_for_model,
+                          to_float32, to_int16)
+from app.core.streaming import PauseChunker, StreamingTranscriber
+from app.core.inference_worker import InferenceWorker
+from app.core.language_lock import LanguageLock
+from app.core.model_cache import create_model_cache
+from app.core.model_reaper import IdleReaper
+from app.core.shared_audio import AudioHandle, cleanup_stale_segments
+from app.core.transcription_executor import TranscriptionExecutor
+from app.core.vad import EnergyVAD, measure_levels, split_points, trim_silence
+from app.common.settings import load_settings
+from utils.file_utils import get_app_directory, ensure_directory_exists
 from app.common.notifier import AudioNotifier
 
 # Set up logging
@@ -34,23 +50,130 @@ class AudioProcessor:
         """Initialize the audio processing system."""
         logger.debug("Initializing AudioProcessor")
         self.app = app
+        self.settings = load_settings()
         
         # Reverting to original working audio settings
-        self.sample_rate: int = 44100
+        self.sample_rate: int = 44100  # Device rate used when 16 kHz is not captured natively
         self.channels: int = 1
         self.dtype = np.int16
         self.blocksize: int = 8192
         
+        # Capture mode: see DEFAULT_SETTINGS['capture_mode']
+        self.capture_mode: str = self.settings['capture_mode']
+        self.resampler: Optional[StreamingResampler] = None
+        self.buffer_sample_rate: int = self.sample_rate
+        self.buffer_channels: int = self.channels
+        
+        # See DEFAULT_SETTINGS['transcription_mode']
+        self.transcription_mode: str = self.settings['transcription_mode']
+        self.streamer: Optional[StreamingTranscriber] = None
+        self.chunker: Optional[PauseChunker] = None
+        
+        # Decode profile used by Cmd+Shift+9, and further Cmd+Shift+<key> chords
+        # that record with another profile
+        self.decode_profile: str = self.settings['decode_profile']
+        self.hotkey_profiles: dict = self.settings['hotkey_profiles']
+        self.recording_profile: str = self.decode_profile
+        
+        # Language passed to Whisper so it can skip its per-clip language detection
+        self.language_lock = LanguageLock(
+            self.settings['language'],
+            adaptive=self.settings['language_lock'],
+            lock_after=self.settings['language_lock_after'],
+            min_probability=self.settings['language_lock_min_probability'],
+            unlock_logprob=self.settings['language_unlock_logprob'],
+            recheck_every=self.settings['language_recheck_every']
+        )
+        
+        # Larger model that re-decodes the low-confidence parts of batch transcriptions
+        self.cascade: Optional[ModelCascade] = None
+        if self.settings['cascade_model']:
+            self.cascade = ModelCascade(
+                self.settings['cascade_model'],
+                min_logprob=self.settings['cascade_min_logprob'],
+                max_compression_ratio=self.settings['cascade_max_compression_ratio'],
+                max_no_speech_prob=self.settings['cascade_max_no_speech_prob'],
+                span_padding=self.settings['cascade_span_padding_seconds'],
+                whole_clip_fraction=self.settings['cascade_whole_clip_fraction']
+            )
+        
+        # Voice activity tracking, used by chunked mode and automatic endpointing
+        self.vad: Optional[EnergyVAD] = None
+        self.auto_stop: bool = self.settings['auto_stop']
+        self.auto_stop_silence_ms: float = self.settings['auto_stop_silence_ms']
+        self.auto_stop_max_seconds: float = self.settings['auto_stop_max_seconds']
+        self._auto_stop_triggered: bool = False
+        
+        # Capture buffer settings: grow a minute at a time, no hard limit
+        self.buffer_chunk_seconds: float = 60.0
+        self.max_recording_seconds: Optional[float] = None
+        
+        # Long recordings move from RAM to a memory-mapped file in the app directory
+        self.spill_bytes: int = int(self.settings['spill_threshold_mb'] * 1024 * 1024)
+        self.spill_dir = get_app_directory() / "recordings"
+        ensure_directory_exists(str(self.spill_dir))
+        cleanup_spill_files(self.spill_dir)
+        
         # Recording state
         self.is_recording: bool = False
         self.ready_to_record: bool = True
-        self.frames: List[np.ndarray] = []
+        self.buffer: Optional[AudioBuffer] = None
+        
+        # Handoff between the real-time callback and the consumer thread
+        self.stream = None
+        self.block_queue: Optional[BlockQueue] = None
+        self.consumer_thread: Optional[Thread] = None
+        self._consumer_stop = Event()
+        self._stream_status = None
+        
+        # Warm stream: stays open between recordings, blocks are only kept while
+        # _retaining is set, otherwise they feed the pre-roll ring
+        self.keep_stream_warm: bool = self.settings['keep_stream_warm']
+        self.preroll: Optional[PreRollBuffer] = None
+        self._retaining: bool = False
+        self._capture_lock = Lock()
+        
+        # Predictive warm-up: holding Cmd+Shift opens the stream early; the timer
+        # closes it again if the chord is not completed
+        self.predictive_warmup: bool = self.settings['predictive_warmup']
+        self._warmup_timer: Optional[Timer] = None
+        self._warmup_lock = Lock()
         
-        # Model management
+        # Model management; all loads go through the single-flight loader, and
+        # further models (other sizes or languages) stay cached within a memory budget
         self.model_manager = ModelManager()
+        self.model_cache = create_model_cache(self.model_manager, self.settings)
         
-        # Thread tracking
-        self.transcription_thread = None
+        # Optionally host the model in a separate process instead of this one
+        self.inference_worker: Optional[InferenceWorker] = None
+        if self.settings['inference_worker']:
+            self.inference_worker = InferenceWorker()
+            self.inference_worker.start()
+            # Recordings live in shared memory the worker maps directly
+            cleanup_stale_segments()
+        
+        # Unloads idle models in the background, also while the app just sits idle;
+        # an idle inference worker is stopped altogether and restarts on the next request
+        self.reaper = IdleReaper(
+            self.model_cache,
+            self.settings['model_idle_timeout_seconds'],
+            per_model=self.settings['model_idle_timeouts'],
+            adaptive=self.settings['adaptive_idle_timeout'],
+            max_timeout=self.settings['model_idle_timeout_max_seconds'],
+            inference_worker=self.inference_worker
+        )
+        self.reaper.start()
+        
+        # Model loads started when recording starts, so they overlap with the user talking
+        self._preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-preload")
+        self._model_future: Optional[Future] = None
+        
+        # Bounded pool that decodes finished clips and delivers results in order
+        self.executor = TranscriptionExecutor(
+            workers=self.settings['transcription_workers'],
+            max_queued=self.settings['transcription_queue_size'],
+            policy=self.settings['transcription_queue_policy']
+        )
         
         # Setup keyboard listener
         self.keys_pressed: Set = set()
@@ -63,23 +186,250 @@ class AudioProcessor:
         # Register cleanup function to be called at exit
         atexit.register(self.cleanup)
         logger.debug("Registered cleanup function with atexit")
+        
+        if self.keep_stream_warm:
+            self._open_warm_stream()
 
-    def ensure_model_loaded(self) -> WhisperModel:
-        """Get a loaded model for transcription."""
+    def ensure_model_loaded(self, model_name: Optional[str] = None) -> WhisperModel:
+        """
+        Get a loaded model for transcription.
+        
+        Args:
+            model_name: Catalog name of the model, defaults to the active model
+        """
         try:
-            return self.model_manager.get_model()
+            return self.model_cache.get_model(model_name)
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             self.icon_state = "❌"
             AudioNotifier.play_sound('error')
             raise
 
-    def transcribe_audio(self, audio_data: np.ndarray) -> Optional[str]:
+    def _load_model(self) -> float:
+        """Load the model where it is used; returns the seconds spent."""
+        started = time.perf_counter()
+        if self.inference_worker is not None:
+            self.inference_worker.load()
+        else:
+            self.model_cache.get_model()
+        return time.perf_counter() - started
+
+    def preload_model(self) -> Future:
+        """
+        Start loading the model in the background if no load is already in flight.
+        
+        Returns:
+            Future that completes once the model is ready
+        """
+        future = self._model_future
+        if future is None or future.done():
+            # Cheap when the model is still loaded, a full load after an idle unload
+            future = self._preload_executor.submit(self._load_model)
+            self._model_future = future
+        return future
+
+    def wait_for_model(self) -> None:
+        """Block until a background model load has finished."""
+        future = self._model_future
+        if future is None:
+            return
+        
+        waiting = not future.done()
+        started = time.perf_counter()
+        try:
+            load_seconds = future.result()
+        except Exception as e:
+            # Loaded again on demand, which reports the error
+            logger.error(f"Model preload failed: {e}")
+            return
+        if waiting:
+            logger.info(f"Waited {time.perf_counter() - started:.2f}s for the model "
+                        f"({load_seconds:.2f}s load started with the recording)")
+
+    def has_speech(self, audio_data: np.ndarray, sample_rate: int) -> bool:
+        """
+        Cheap level check that rules out accidental taps and silent recordings.
+        
+        Args:
+            audio_data: The captured audio
+            sample_rate: Sample rate of audio_data
+            
+        Returns:
+            False if the clip is too short or too quiet to contain speech
+        """
+        started = time.perf_counter()
+        levels = measure_levels(audio_data, sample_rate, threshold_db=self.settings['vad_threshold_db'])
+        
+        if levels.duration < self.settings['min_recording_seconds']:
+            reason = f"clip is only {levels.duration:.2f}s long"
+        elif levels.peak_db < self.settings['silence_peak_db']:
+            reason = f"peak level is {levels.peak_db:.1f} dBFS"
+        elif levels.voiced_ratio < self.settings['min_voiced_ratio']:
+            reason = f"only {levels.voiced_ratio:.1%} of frames are voiced"
+        else:
+            return True
+        
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        logger.info(f"Skipping transcription, {reason} (RMS {levels.rms_db:.1f} dBFS, checked in {elapsed_us:.0f}us)")
+        return False
+
+    def trim_clip(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Trim leading and trailing silence and report how much was removed.
+        
+        Args:
+            audio_data: The captured audio
+            sample_rate: Sample rate of audio_data
+            
+        Returns:
+            View of audio_data without the silent edges
+        """
+        duration = len(audio_data) / sample_rate
+        trimmed, lead, trail = trim_silence(
+            audio_data,
+            sample_rate,
+            guard_ms=self.settings['trim_guard_ms'],
+            threshold_db=self.settings['vad_threshold_db']
+        )
+        if lead or trail:
+            windows_before = -(-duration // 30)
+            windows_after = -(-(duration - lead - trail) // 30)
+            logger.info(f"Trimmed {lead:.2f}s leading and {trail:.2f}s trailing silence "
+                        f"({duration:.1f}s -> {duration - lead - trail:.1f}s, "
+                        f"{windows_before:.0f} -> {windows_after:.0f} decode windows)")
+        return trimmed
+
+    def decode_options(self, profile: Optional[str] = None, **options) -> dict:
+        """
+        Return the options of a decode profile with `options` applied on top.
+        
+        The configured or pinned language is included, so Whisper skips
+        language detection.
+        
+        Args:
+            profile: Decode profile name, defaults to the configured profile
+            **options: Overrides for individual options
+        """
+        decode_options = profile_options(profile or self.decode_profile)
+        language = self.language_lock.language()
+        if language:
+            decode_options['language'] = language
+        decode_options.update(options)
+        return decode_options
+
+    def decode_segments(self, audio: np.ndarray, model_name: Optional[str] = None,
+                        profile: Optional[str] = None, **options) -> list:
+        """
+        Run the Whisper model over model-ready audio.
+        
+        Args:
+            audio: 16 kHz mono float32 audio
+            model_name: Catalog name of the model to use, defaults to the active model
+            profile: Decode profile name, defaults to the configured profile
+            **options: Overrides for the profile's decoding options
+            
+        Returns:
+            List of decoded segments
+        """
+        decode_options = self.decode_options(profile, **options)
+        self.wait_for_model()
+        
+        # Streaming passes and chunk decodes share the executor's decode slots with queued clips
+        with self.executor.decode_slots:
+            if self.inference_worker is not None:
+                started = time.perf_counter()
+                segments, info = self.inference_worker.transcribe(audio, model_name=model_name, **decode_options)
+                elapsed = time.perf_counter() - started
+            else:
+                model = self.ensure_model_loaded(model_name)
+                self.model_cache.begin_decode(model_name)
+                try:
+                    started = time.perf_counter()
+                    segments, info = model.transcribe(audio, **decode_options)
+                    segments = list(segments)
+                    elapsed = time.perf_counter() - started
+                finally:
+                    self.model_cache.end_decode(model_name)
+                self.model_cache.record_decode(model_name, elapsed, len(audio) / WHISPER_SAMPLE_RATE)
+        
+        self.language_lock.observe(info, segments, elapsed, len(audio) / WHISPER_SAMPLE_RATE,
+                                   detected=not decode_options.get('language'))
+        return segments
+
+    def decode_shared(self, handle: AudioHandle, model_name: Optional[str] = None,
+                      profile: Optional[str] = None, **options) -> list:
+        """
+        Decode captured audio in the inference worker without copying it over the pipe.
+        
+        Args:
+            handle: Handle to a slice of the shared recording buffer
+            model_name: Catalog name of the model to use, defaults to the active model
+            profile: Decode profile name, defaults to the configured profile
+            **options: Overrides for the profile's decoding options
+            
+        Returns:
+            List of decoded segments
+        """
+        decode_options = self.decode_options(profile, **options)
+        self.wait_for_model()
+        with self.executor.decode_slots:
+            started = time.perf_counter()
+            segments, info = self.inference_worker.transcribe_shared(handle, model_name=model_name, **decode_options)
+            elapsed = time.perf_counter() - started
+        self.language_lock.observe(info, segments, elapsed, (handle.stop - handle.start) / handle.sample_rate,
+                                   detected=not decode_options.get('language'))
+        return segments
+
+    def decode_window(self, window: np.ndarray, sample_rate: int, buffer: Optional[AudioBuffer] = None,
+                      profile: Optional[str] = None) -> list:
+        """
+        Decode one window of a recording, escalating unreliable parts when a cascade is configured.
+        
+        Args:
+            window: Captured audio at sample_rate
+            sample_rate: Sample rate of window
+            buffer: Buffer window is a view of, lets the inference worker map it directly
+            profile: Decode profile name, defaults to the configured profile
+            
+        Returns:
+            List of decoded segments
+        """
+        # Whatever the decode profile, the cascade needs segment timestamps to find
+        # unsure spans; without them there is a single segment per 30s window
+        options = {} if self.cascade is None else {'without_timestamps': False}
+        
+        def first_pass() -> list:
+            handle = None
+            if buffer is not None and self.inference_worker is not None:
+                handle = buffer.handle(window)
+            if handle is not None:
+                # Only the handle crosses the pipe; the worker converts the audio itself
+                return self.decode_shared(handle, profile=profile, **options)
+            
+            # Convert once to the 16 kHz float32 array Whisper expects,
+            # no temporary file or decode/resample round trip
+            return self.decode_segments(prepare_for_model(window, sample_rate), profile=profile, **options)
+        
+        if self.cascade is None:
+            return first_pass()
+        
+        def redecode(start: float, end: float) -> list:
+            span = window[int(start * sample_rate):int(end * sample_rate)]
+            return self.decode_segments(prepare_for_model(span, sample_rate),
+                                        model_name=self.cascade.model, profile=profile)
+        
+        return self.cascade.decode(first_pass, redecode, len(window) / sample_rate)
+
+    def transcribe_audio(self, audio_data: np.ndarray, sample_rate: Optional[int] = None,
+                         buffer: Optional[AudioBuffer] = None, profile: Optional[str] = None) -> Optional[str]:
         """
         Transcribe audio using Whisper.
         
         Args:
             audio_data: The audio data to transcribe
+            sample_rate: Sample rate of audio_data, defaults to the device rate
+            buffer: Buffer audio_data is a view of, lets the inference worker map it directly
+            profile: Decode profile name, defaults to the configured profile
             
         Returns:
             Transcription text or None if transcription failed
@@ -88,72 +438,90 @@ class AudioProcessor:
             logger.info("Starting transcription")
             self.icon_state = "💭"  # Thinking emoji
             
-            # Get model for transcription
-            model = self.ensure_model_loaded()
+            sample_rate = sample_rate or self.sample_rate
             
-            # Save temporary audio file
-            temp_file = "temp_recording.wav"
-            with wave.open(temp_file, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data.tobytes())
+            # Drop leading/trailing silence so the decoder sees fewer 30s windows
+            audio_data = self.trim_clip(audio_data, sample_rate)
             
-            # Transcribe using Faster Whisper
-            try:
-                segments, _ = model.transcribe(
-                    temp_file,
-                    beam_size=5,
-                    word_timestamps=True,
-                    vad_filter=True,
-                    vad_parameters=dict(min_silence_duration_ms=500)
-                )
-                
-                # Process segments
-                text_segments = []
-                for segment in segments:
-                    # Clean up the segment text
-                    segment_text = segment.text.strip()
-                    if segment_text:
-                        text_segments.append(segment_text)
+            # Very long clips are decoded window by window, so only one window
+            # (not a memory-mapped hour) is ever converted to float32 at once
+            cuts = split_points(audio_data, sample_rate, self.settings['decode_window_seconds'])
+            bounds = [0] + cuts + [len(audio_data)]
+            if cuts:
+                logger.info(f"Decoding {len(audio_data) / sample_rate:.0f}s clip in {len(bounds) - 1} windows")
+            
+            segments = []
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                segments.extend(self.decode_window(audio_data[start:end], sample_rate, buffer, profile))
+            
+            # Process segments
+            text_segments = []
+            for segment in segments:
+                # Clean up the segment text
+                segment_text = segment.text.strip()
+                if segment_text:
+                    text_segments.append(segment_text)
+            
+            # Join and process the text
+            if text_segments:
+                text = ' '.join(text_segments)
+                processed_text = process_text(text)
+                logger.info(f"Transcription successful: {processed_text}")
+                return processed_text
+            else:
+                logger.warning("No speech detected in audio")
+                return None
                 
-                # Join and process the text
-                if text_segments:
-                    text = ' '.join(text_segments)
-                    processed_text = process_text(text)
-                    logger.info(f"Transcription successful: {processed_text}")
-                    
-                    # Check if we should unload the model
-                    self.model_manager.check_timeout()
-                    
-                    return processed_text
-                else:
-                    logger.warning("No speech detected in audio")
-                    return None
-                    
-            finally:
-                # Ensure temporary file is always cleaned up
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             return None
         finally:
             self.icon_state = "🎤"  # Reset icon
 
+    def finish_streaming(self, streamer) -> Optional[str]:
+        """
+        Decode the uncommitted tail of a streaming or pause-chunked transcription.
+        
+        Args:
+            streamer: The StreamingTranscriber or PauseChunker used for the recording
+            
+        Returns:
+            Transcription text or None if nothing was recognized
+        """
+        try:
+            self.icon_state = "💭"  # Thinking emoji
+            text = streamer.finish()
+            if not text:
+                logger.warning("No speech detected in audio")
+                return None
+            
+            processed_text = process_text(text)
+            logger.info(f"Transcription successful: {processed_text}")
+            return processed_text
+        except Exception as e:
+            logger.error(f"Error finishing streaming transcription: {e}")
+            return None
+        finally:
+            self.icon_state = "🎤"  # Reset icon
+
     def on_press(self, key: keyboard.Key) -> None:
         """Handle key press events."""
         try:
             # Add the key to the set of pressed keys
             self.keys_pressed.add(key)
             
-            # Check for Command+Shift+9 combination
+            if self.predictive_warmup:
+                self._maybe_warm_up()
+            
+            # Check for Command+Shift+9, or another Command+Shift chord mapped to a profile
             if (keyboard.Key.cmd in self.keys_pressed and 
                 keyboard.Key.shift in self.keys_pressed and 
-                hasattr(key, 'char') and key.char == '9'):
-                # Toggle recording
-                self.toggle_recording()
+                hasattr(key, 'char')):
+                if key.char == '9':
+                    # Toggle recording
+                    self.toggle_recording()
+                elif key.char in self.hotkey_profiles:
+                    self.toggle_recording(self.hotkey_profiles[key.char])
         except Exception as e:
             logger.error(f"Error in key press handler: {e}")
 
@@ -165,50 +533,330 @@ class AudioProcessor:
         except Exception as e:
             logger.error(f"Error in key release handler: {e}")
 
-    def toggle_recording(self) -> None:
-        """Toggle recording state."""
+    def _maybe_warm_up(self) -> None:
+        """Start warming up the model and input stream once the hotkey prefix is held."""
+        if (self.is_recording or
+            keyboard.Key.cmd not in self.keys_pressed or
+            keyboard.Key.shift not in self.keys_pressed):
+            return
+        
+        with self._warmup_lock:
+            if self._warmup_timer is not None:
+                return
+            window = self.settings['predictive_warmup_window_ms'] / 1000
+            timer = Timer(window, lambda: self._expire_warmup(timer))
+            timer.daemon = True
+            self._warmup_timer = timer
+        
+        # Opening a stream can take a while; keep it off the keyboard listener thread
+        Thread(target=self._warm_up, args=(timer,), daemon=True).start()
+
+    def _warm_up(self, timer: Timer) -> None:
+        """Preload the model and pre-open the input stream for an expected recording."""
+        logger.debug("Hotkey prefix held, warming up")
+        self.preload_model()
+        with self._warmup_lock:
+            if self._warmup_timer is not timer:
+                # Recording already started, or the window already passed
+                return
+            if self.stream is None:
+                self._open_warm_stream()
+            timer.start()
+
+    def _expire_warmup(self, timer: Timer) -> None:
+        """Close a predictively opened stream when the hotkey was not completed in time."""
+        with self._warmup_lock:
+            if self._warmup_timer is not timer:
+                return
+            self._warmup_timer = None
+            if self.is_recording or self.keep_stream_warm or self.stream is None:
+                return
+            logger.debug("Hotkey not completed, closing pre-opened input stream")
+            self._close_stream()
+            self.preroll = None
+
+    def _claim_warmup(self) -> None:
+        """Take over a predictively opened stream, waiting for it if it is still opening."""
+        with self._warmup_lock:
+            if self._warmup_timer is not None:
+                self._warmup_timer.cancel()
+                self._warmup_timer = None
+
+    def toggle_recording(self, profile: Optional[str] = None) -> None:
+        """
+        Toggle recording state.
+        
+        Args:
+            profile: Decode profile for a recording started now, defaults to the configured profile
+        """
         if self.is_recording:
             self.stop_recording()
         else:
-            self.start_recording()
+            self.start_recording(profile)
+
+    def _configure_capture(self) -> int:
+        """
+        Choose the stream sample rate for the configured capture mode.
+        
+        Sets the resampler and the rate/channels of the audio that reaches the buffer.
+        
+        Returns:
+            Sample rate to open the input stream with
+        """
+        self.resampler = None
+        stream_rate = self.sample_rate
+        
+        if self.capture_mode == 'auto':
+            try:
+                sd.check_input_settings(samplerate=WHISPER_SAMPLE_RATE, channels=self.channels, dtype=self.dtype)
+                logger.debug("Input device supports 16 kHz, capturing natively")
+                stream_rate = WHISPER_SAMPLE_RATE
+            except Exception as e:
+                logger.debug(f"Input device cannot capture at 16 kHz ({e}), resampling while recording")
+        
+        if self.capture_mode != 'device' and stream_rate != WHISPER_SAMPLE_RATE:
+            self.resampler = StreamingResampler(stream_rate, WHISPER_SAMPLE_RATE)
+        
+        self.buffer_sample_rate = WHISPER_SAMPLE_RATE if self.resampler else stream_rate
+        self.buffer_channels = 1 if self.resampler else self.channels
+        return stream_rate
+
+    def _open_stream(self, stream_rate: int) -> None:
+        """Open and start the input stream together with its block queue and consumer thread."""
+        # The callback only queues blocks; all processing happens on the consumer thread
+        slots = int(-(-self.settings['capture_queue_seconds'] * stream_rate // self.blocksize))
+        self.block_queue = BlockQueue(max(2, slots), self.blocksize, self.channels, self.dtype)
+        self._consumer_stop = Event()
+        self.consumer_thread = Thread(
+            target=self._consume_blocks,
+            args=(self.block_queue, self._consumer_stop, self.blocksize / stream_rate),
+            daemon=True
+        )
+        self.consumer_thread.start()
+        
+        self.stream = sd.InputStream(
+            samplerate=stream_rate,
+            channels=self.channels,
+            dtype=self.dtype,
+            blocksize=self.blocksize,
+            callback=self.callback
+        )
+        self.stream.start()
+
+    def _close_stream(self) -> None:
+        """Close the input stream and let the consumer drain what was already queued."""
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                logger.error(f"Error closing input stream: {e}")
+            self.stream = None
+        
+        self._consumer_stop.set()
+        if self.consumer_thread is not None:
+            self.consumer_thread.join()
+            self.consumer_thread = None
+        if self.block_queue is not None and self.block_queue.overflows:
+            logger.warning(f"Capture queue overflowed, dropped {self.block_queue.overflows} blocks")
+
+    def _open_warm_stream(self) -> None:
+        """Open the persistent stream that idles between recordings."""
+        try:
+            started = time.perf_counter()
+            stream_rate = self._configure_capture()
+            preroll_frames = int(self.settings['preroll_ms'] / 1000 * self.buffer_sample_rate)
+            self.preroll = PreRollBuffer(preroll_frames, self.buffer_channels, self.dtype)
+            self._open_stream(stream_rate)
+            logger.info(f"Warm input stream opened in {(time.perf_counter() - started) * 1000:.0f}ms")
+        except Exception as e:
+            logger.error(f"Error opening warm input stream: {e}")
+            self.stream = None
+
+    def _wait_for_consumer(self, mark: int, timeout: float = 1.0) -> None:
+        """Wait until the consumer has handled every block queued before `mark`."""
+        deadline = time.time() + timeout
+        while self.block_queue.consumed < mark and time.time() < deadline:
+            time.sleep(0.005)
 
-    def start_recording(self) -> None:
-        """Start recording audio."""
+    def start_recording(self, profile: Optional[str] = None) -> None:
+        """
+        Start recording audio.
+        
+        Args:
+            profile: Decode profile for this recording, defaults to the configured profile
+        """
         if self.is_recording or not self.ready_to_record:
             logger.warning("Cannot start recording: already recording or not ready")
             return
+        
+        if self.executor.policy == 'backpressure' and self.executor.is_full:
+            logger.warning("Cannot start recording: transcription queue is full")
+            AudioNotifier.play_sound('error')
+            return
             
         try:
-            logger.info("Starting recording")
+            started = time.perf_counter()
+            self.recording_profile = profile or self.decode_profile
+            logger.info(f"Starting recording ({self.recording_profile} decode profile)")
             self.ready_to_record = False  # Prevent multiple starts
-            self.frames = []  # Clear previous frames
+            
+            # If the idle timeout unloaded the model, reload it while the user talks
+            self.preload_model()
+            
+            # Kept warm by setting, or opened by the predictive warm-up
+            self._claim_warmup()
+            warm = self.stream is not None and self.stream.active
+            if not warm:
+                # Cold start, or a warm stream that died (e.g. device unplugged)
+                self._close_stream()
+                stream_rate = self._configure_capture()
+            
+            # Fresh buffer per recording so views handed to transcription stay valid
+            self.buffer = AudioBuffer(
+                self.buffer_sample_rate,
+                channels=self.buffer_channels,
+                dtype=self.dtype,
+                chunk_seconds=self.buffer_chunk_seconds,
+                max_seconds=self.max_recording_seconds,
+                spill_bytes=self.spill_bytes,
+                spill_dir=self.spill_dir,
+                shared=self.inference_worker is not None
+            )
+            
+            # Decode in the background while the user is still talking
+            self.streamer = None
+            self.chunker = None
+            self.vad = None
+            self._auto_stop_triggered = False
+            if self.transcription_mode == 'chunked' or self.auto_stop:
+                self.vad = EnergyVAD(self.buffer.sample_rate, threshold_db=self.settings['vad_threshold_db'])
+            
+            if self.transcription_mode == 'chunked':
+                buffer = self.buffer
+                self.chunker = PauseChunker(
+                    partial(self.decode_segments, profile=self.recording_profile),
+                    buffer.view,
+                    buffer.sample_rate,
+                    self.vad,
+                    pause_seconds=self.settings['pause_commit_seconds']
+                )
+            elif self.transcription_mode == 'streaming':
+                buffer = self.buffer
+                self.streamer = StreamingTranscriber(
+                    partial(self.decode_segments, profile=self.recording_profile),
+                    buffer.view,
+                    buffer.sample_rate,
+                    interval=self.settings['streaming_interval'],
+                    on_partial=lambda text: logger.debug(f"Partial transcription: {text}")
+                )
+            
             self.is_recording = True
+            if warm:
+                # Just start keeping blocks, beginning with the audio from before the key press
+                with self._capture_lock:
+                    preroll = self.preroll.snapshot()
+                    self.buffer.write(preroll)
+                    self._retaining = True
+            else:
+                self._retaining = True
+                self._open_stream(stream_rate)
+            
+            latency_ms = (time.perf_counter() - started) * 1000
+            source = f"warm stream, {len(preroll) / self.buffer_sample_rate * 1000:.0f}ms pre-roll" if warm else "cold stream"
+            logger.info(f"Recording started in {latency_ms:.1f}ms ({source})")
             
             # Update app state
             self.app.set_state('recording')
             
-            # Start recording stream
-            self.stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=self.dtype,
-                blocksize=self.blocksize,
-                callback=self.callback
-            )
-            self.stream.start()
+            if self.streamer is not None:
+                self.streamer.start()
             
         except Exception as e:
             logger.error(f"Error starting recording: {e}")
             self.is_recording = False
+            self._retaining = False
+            if not self.keep_stream_warm:
+                self._close_stream()
+            for background in (self.streamer, self.chunker):
+                if background is not None:
+                    background.cancel()
+            self.streamer = None
+            self.chunker = None
             AudioNotifier.play_sound('error')
         finally:
             self.ready_to_record = True  # Ready for next recording
 
     def callback(self, indata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags) -> None:
-        """Callback for audio stream to collect frames."""
+        """Callback for audio stream; copies the block into the queue and nothing else."""
         if status:
-            logger.warning(f"Audio callback status: {status}")
-        self.frames.append(indata.copy())
+            self._stream_status = status
+        self.block_queue.put(indata)
+
+    def _consume_blocks(self, block_queue: BlockQueue, stop: Event, block_seconds: float) -> None:
+        """Drain captured blocks into the buffer until stopped and the queue is empty."""
+        poll_interval = min(0.02, block_seconds / 4)
+        while True:
+            block = block_queue.peek()
+            if block is None:
+                if stop.is_set():
+                    break
+                time.sleep(poll_interval)
+                continue
+            
+            try:
+                if self._stream_status:
+                    logger.warning(f"Audio callback status: {self._stream_status}")
+                    self._stream_status = None
+                self._handle_block(block)
+            except Exception as e:
+                logger.error(f"Error processing audio block: {e}")
+            finally:
+                block_queue.release()
+
+    def _handle_block(self, indata: np.ndarray) -> None:
+        """Resample, buffer and analyse one captured block."""
+        block = indata
+        if self.resampler is not None:
+            # Resample as we go so the buffer is model-ready when recording stops
+            block = to_int16(self.resampler.process(to_float32(indata)))[:, None]
+        
+        with self._capture_lock:
+            if not self._retaining:
+                # Idle warm stream: only remember the last moments before a key press
+                if self.preroll is not None:
+                    self.preroll.write(block)
+                return
+            self._retain_block(block)
+
+    def _retain_block(self, block: np.ndarray) -> None:
+        """Buffer and analyse a block that belongs to the current recording."""
+        self.buffer.write(block)
+        
+        if self.vad is not None:
+            speech = self.vad.process(block)
+            chunker = self.chunker
+            if chunker is not None:
+                chunker.update(speech)
+            if self.auto_stop:
+                self._check_endpoint()
+
+    def _check_endpoint(self) -> None:
+        """Stop recording once speech is followed by enough silence, or at the maximum duration."""
+        if self._auto_stop_triggered or not self.is_recording:
+            return
+        
+        trailing_ms = self.vad.trailing_silence * 1000
+        if self.vad.speech_seen and trailing_ms >= self.auto_stop_silence_ms:
+            logger.info(f"Auto-stopping after {trailing_ms:.0f}ms of trailing silence")
+        elif self.buffer.duration >= self.auto_stop_max_seconds:
+            logger.info(f"Auto-stopping at the {self.auto_stop_max_seconds:.0f}s maximum duration")
+        else:
+            return
+        
+        # stop_recording joins the consumer thread, so it must run elsewhere
+        self._auto_stop_triggered = True
+        Thread(target=self.stop_recording, daemon=True).start()
 
     def stop_recording(self) -> None:
         """Stop recording and process the audio."""
@@ -226,47 +874,87 @@ class AudioProcessor:
             # Play stop sound
             AudioNotifier.play_sound('stop')
             
-            # Stop and close the stream
-            if hasattr(self, 'stream'):
-                self.stream.stop()
-                self.stream.close()
+            if self.keep_stream_warm and self.stream is not None and self.stream.active:
+                # Keep the stream open, but retain everything queued before the key press
+                self._wait_for_consumer(self.block_queue.written)
+                with self._capture_lock:
+                    self._retaining = False
+                    self.preroll.clear()
+            else:
+                # Stop and close the stream, letting the consumer drain the last blocks
+                self._close_stream()
+                self._retaining = False
+                
+                # Emit the resampler's last few samples
+                if self.resampler is not None and self.buffer is not None:
+                    self.buffer.write(to_int16(self.resampler.flush())[:, None])
+            
+            streamer = self.streamer or self.chunker
+            self.streamer = None
+            self.chunker = None
+            profile = self.recording_profile
             
             # Process the recorded audio if we have frames
-            if self.frames:
-                # Convert frames to a single array
-                audio_data = np.concatenate(self.frames, axis=0)
+            if self.buffer is not None and len(self.buffer):
+                # Zero-copy view of everything captured
+                buffer = self.buffer
+                audio_data = buffer.view()
+                sample_rate = self.buffer.sample_rate
+                if self.buffer.dropped_frames:
+                    logger.warning(f"Recording hit the {self.max_recording_seconds}s limit, "
+                                   f"dropped {self.buffer.dropped_frames / sample_rate:.1f}s of audio")
+                
+                # Accidental taps and silent recordings never touch the model
+                if not self.has_speech(audio_data, sample_rate):
+                    if streamer is not None:
+                        streamer.cancel()
+                    buffer.close()
+                    AudioNotifier.play_sound('error')
+                    self.app.set_state('idle')
+                    return
                 
-                # Start transcription in a separate thread to keep UI responsive
-                def transcribe_thread():
+                def transcribe_job() -> Optional[str]:
                     try:
                         # Transcribe the audio
                         logger.info("Starting transcription")
-                        transcription = self.transcribe_audio(audio_data)
+                        if streamer is not None:
+                            return self.finish_streaming(streamer)
+                        return self.transcribe_audio(audio_data, sample_rate, buffer, profile)
+                    finally:
+                        # Frees RAM or deletes the spill file; a shared segment is
+                        # only unlinked here, after the worker has replied
+                        buffer.close()
+                
+                def deliver(transcription: Optional[str]) -> None:
+                    if transcription:
+                        # Copy to clipboard
+                        pyperclip.copy(transcription)
+                        logger.info(f"Transcription successful: {transcription}")
+                        logger.info("Transcription copied to clipboard")
                         
-                        if transcription:
-                            # Copy to clipboard
-                            pyperclip.copy(transcription)
-                            logger.info(f"Transcription successful: {transcription}")
-                            logger.info("Transcription copied to clipboard")
-                            
-                            # Set completed state
-                            self.app.set_state('completed')
-                        else:
-                            logger.warning("No transcription result")
-                            AudioNotifier.play_sound('error')
-                            self.app.set_state('idle')
-                    except Exception as e:
-                        logger.error(f"Error in transcription thread: {e}")
+                        # Set completed state
+                        self.app.set_state('completed')
+                    else:
+                        logger.warning("No transcription result")
                         AudioNotifier.play_sound('error')
                         self.app.set_state('idle')
                 
-                # Start the transcription thread and track it
-                self.transcription_thread = Thread(target=transcribe_thread)
-                self.transcription_thread.daemon = True  # Make it a daemon thread
-                self.transcription_thread.start()
-                logger.debug("Transcription thread started")
+                def dropped() -> None:
+                    logger.warning("Clip dropped by the transcription queue")
+                    if streamer is not None:
+                        streamer.cancel()
+                    buffer.close()
+                    AudioNotifier.play_sound('error')
+                    if not self.executor.busy:
+                        self.app.set_state('idle')
+                
+                # Decode on the worker pool to keep the UI responsive
+                self.executor.submit(transcribe_job, deliver, dropped)
+                logger.debug("Transcription job queued")
             else:
                 logger.warning("No audio frames captured")
+                if streamer is not None:
+                    streamer.cancel()
                 self.app.set_state('idle')
                 
         except Exception as e:
@@ -276,19 +964,18 @@ class AudioProcessor:
 
     def save_audio(self, filename: str) -> Optional[np.ndarray]:
         """Save recorded audio to a WAV file."""
-        if not self.frames:
+        if self.buffer is None or not len(self.buffer):
             logger.warning("No audio frames to save")
             return None
             
         try:
-            # Combine all frames
-            audio_data = np.concatenate(self.frames, axis=0)
+            audio_data = self.buffer.view()
             
             # Save to WAV file
             with wave.open(filename, 'wb') as wf:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.sample_rate)
+                wf.setframerate(self.buffer.sample_rate)
                 wf.writeframes(audio_data.tobytes())
                 
             logger.info(f"Audio saved to {filename}")
@@ -306,22 +993,37 @@ class AudioProcessor:
             logger.info("Stopping keyboard listener")
             self.listener.stop()
         
-        # Stop audio stream if active
-        if hasattr(self, 'stream') and self.stream and self.stream.active:
+        # Stop audio stream and its consumer thread if active
+        if hasattr(self, 'stream') and self.stream:
             logger.info("Stopping audio stream")
-            self.stream.stop()
-            self.stream.close()
+            self._close_stream()
+        
+        # Stop transcription workers
+        if hasattr(self, 'executor') and self.executor:
+            logger.info("Waiting for transcription workers to complete")
+            # Give queued clips a chance to complete naturally
+            self.executor.shutdown(timeout=2.0)
         
-        # Stop transcription thread if active
-        if hasattr(self, 'transcription_thread') and self.transcription_thread and self.transcription_thread.is_alive():
-            logger.info("Waiting for transcription thread to complete")
-            # Give the thread a chance to complete naturally
-            self.transcription_thread.join(timeout=2.0)
+        # Do not hold up exit for a model load that is still in flight
+        if hasattr(self, '_preload_executor') and self._preload_executor:
+            self._preload_executor.shutdown(wait=False)
+        
+        if hasattr(self, 'language_lock') and self.language_lock:
+            logger.info(f"Language detection: {self.language_lock.summary()}")
+        if hasattr(self, 'cascade') and self.cascade:
+            logger.info(f"Model cascade: {self.cascade.summary()}")
         
         # Unload model if loaded
-        if hasattr(self, 'model_manager') and self.model_manager:
-            logger.info("Unloading Whisper model")
-            self.model_manager.unload_model()
+        if hasattr(self, 'reaper') and self.reaper:
+            self.reaper.stop()
+        if hasattr(self, 'model_cache') and self.model_cache:
+            logger.info("Unloading Whisper models")
+            self.model_cache.unload_all()
+        
+        # Terminating the inference worker frees everything its model held
+        if hasattr(self, 'inference_worker') and self.inference_worker:
+            logger.info("Stopping inference worker")
+            self.inference_worker.stop()
         
         # Force garbage collection
         logger.info("Forcing garbage collection")
@@ -0,0 +1,159 @@
+#app/core/calibration.py
+
+import gc
+import logging
+import os
+import time
+from threading import Thread
+from typing import Any, Callable, Dict, List, Optional
+import psutil
+from faster_whisper import WhisperModel
+
+from app.common.settings import save_calibration
+from app.core.decode_profiles import profile_options
+from app.core.dsp import WHISPER_SAMPLE_RATE, synthetic_speech
+from app.core.model_cache import warm_up_model
+from app.core.model_catalog import resolve_model
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Compute types worth trying on a CPU, fastest-but-least-precise first
+COMPUTE_TYPES = ('int8', 'int8_float32', 'float32')
+
+# Length of the clip every candidate decodes
+CLIP_SECONDS = 8.0
+
+def thread_candidates() -> List[int]:
+    """Thread counts to try: half the physical cores, all physical cores and all logical cores."""
+    logical = os.cpu_count() or 4
+    physical = psutil.cpu_count(logical=False) or logical
+    return sorted({max(1, physical // 2), physical, logical})
+
+def _time_decodes(model: WhisperModel, clip, options: Dict[str, Any], concurrency: int, repeats: int = 2) -> float:
+    """
+    Time decoding the clip `concurrency` times in parallel.
+
+    Returns:
+        Best wall time over `repeats` rounds, divided by the number of clips decoded
+    """
+    def decode() -> None:
+        segments, _ = model.transcribe(clip, **options)
+        list(segments)
+
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        threads = [Thread(target=decode) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        best = min(best, (time.perf_counter() - started) / concurrency)
+    return best
+
+def _measure(location: str, clip, options: Dict[str, Any], concurrency: int, compute_type: str,
+             cpu_threads: int, num_workers: int) -> Optional[Dict[str, Any]]:
+    """
+    Load the model with one combination of settings and time it.
+
+    Returns:
+        Dictionary of the settings and seconds_per_clip, or None if the combination failed
+    """
+    model = None
+    try:
+        model = WhisperModel(location, device="cpu", compute_type=compute_type,
+                             cpu_threads=cpu_threads, num_workers=num_workers)
+        warm_up_model(model)
+        seconds = _time_decodes(model, clip, options, concurrency)
+        logger.info(f"Calibration {compute_type}, {cpu_threads} threads, {num_workers} worker(s): "
+                    f"{seconds:.2f}s per {CLIP_SECONDS:.0f}s clip")
+        return {
+            'compute_type': compute_type,
+            'cpu_threads': cpu_threads,
+            'num_workers': num_workers,
+            'seconds_per_clip': seconds,
+        }
+    except Exception as e:
+        # e.g. a compute type this CPU does not support
+        logger.warning(f"Calibration {compute_type}, {cpu_threads} threads, {num_workers} worker(s) failed: {e}")
+        return None
+    finally:
+        del model
+        gc.collect()
+
+def calibrate(model_manager, model_name: Optional[str] = None, concurrency: int = 1,
+              progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Find the fastest compute_type, cpu_threads and num_workers for this computer and save them.
+
+    Each candidate loads the model, warms it up and decodes the same synthetic
+    clip. Rather than trying every combination, the compute type is chosen
+    first at the physical core count, then the thread count for that compute
+    type, then the number of workers, so a large model is loaded at most six
+    times.
+
+    Args:
+        model_manager: ModelManager used to locate the downloaded model
+        model_name: Model to benchmark, defaults to the active model
+        concurrency: Clips decoded at the same time by the app (transcription_workers)
+        progress_callback: Called with (candidates done, total candidates)
+
+    Returns:
+        The saved calibration, or None if no candidate could be measured
+    """
+    model_name = model_name or model_manager.current_model
+    exists, location = resolve_model(model_manager, model_name)
+    if not exists:
+        logger.error(f"Cannot calibrate, model {model_name} is not downloaded")
+        return None
+
+    clip = synthetic_speech(CLIP_SECONDS)
+    options = profile_options('fast')
+    # Decode the whole clip regardless of what the VAD thinks of it
+    options['vad_filter'] = False
+
+    concurrency = max(1, concurrency)
+    threads = thread_candidates()
+    default_threads = psutil.cpu_count(logical=False) or threads[-1]
+    total = len(COMPUTE_TYPES) + len(threads) - 1 + (concurrency > 1)
+    results = []
+    done = [0]
+
+    def measure(compute_type: str, cpu_threads: int, num_workers: int) -> None:
+        result = _measure(location, clip, options, concurrency, compute_type, cpu_threads, num_workers)
+        if result is not None:
+            results.append(result)
+        done[0] += 1
+        if progress_callback:
+            progress_callback(done[0], total)
+
+    def fastest() -> Optional[Dict[str, Any]]:
+        return min(results, key=lambda result: result['seconds_per_clip'], default=None)
+
+    # 1. Compute type, at the physical core count
+    for compute_type in COMPUTE_TYPES:
+        measure(compute_type, default_threads, 1)
+    best = fastest()
+    if best is None:
+        logger.error("Calibration failed for every compute type")
+        return None
+
+    # 2. Thread count, for the fastest compute type
+    for cpu_threads in threads:
+        if cpu_threads != default_threads:
+            measure(best['compute_type'], cpu_threads, 1)
+    best = fastest()
+
+    # 3. Parallel decodes, when the app runs several transcriptions at once
+    if concurrency > 1:
+        measure(best['compute_type'], best['cpu_threads'], concurrency)
+        best = fastest()
+
+    calibration = dict(best, model=model_name, concurrency=concurrency,
+                       real_time_factor=best['seconds_per_clip'] * WHISPER_SAMPLE_RATE / len(clip),
+                       results=results)
+    logger.info(f"Fastest model settings: {best['compute_type']}, {best['cpu_threads']} threads, "
+                f"{best['num_workers']} worker(s) ({best['seconds_per_clip']:.2f}s per clip)")
+    save_calibration(calibration)
+    return calibration
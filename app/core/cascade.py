@@ -0,0 +1,143 @@
+#app/core/cascade.py
+
+import dataclasses
+import logging
+from threading import Lock
+from typing import Any, Callable
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def _shift(item: Any, offset: float) -> Any:
+    """Return a segment or word with its timestamps moved by `offset` seconds."""
+    changes = {'start': item.start + offset, 'end': item.end + offset}
+    if getattr(item, 'words', None):
+        changes['words'] = [_shift(word, offset) for word in item.words]
+    if dataclasses.is_dataclass(item):
+        return dataclasses.replace(item, **changes)
+    if hasattr(item, '_replace'):
+        return item._replace(**changes)
+    return item
+
+class ModelCascade:
+    """Re-decodes only the low-confidence parts of a clip with a larger model.
+
+    The clip is first decoded with the active (fast) model. Runs of segments
+    that look unreliable are decoded again with `model`, padded a little but
+    never into the confident neighbours; when most of the clip is unreliable
+    the whole clip is decoded again instead.
+    """
+
+    def __init__(self, model: str, min_logprob: float = -1.0, max_compression_ratio: float = 2.4,
+                 max_no_speech_prob: float = 0.6, span_padding: float = 0.5, whole_clip_fraction: float = 0.5):
+        """
+        Initialize the cascade.
+
+        Args:
+            model: Catalog name of the larger model used for escalation
+            min_logprob: Segments with a lower average log probability are escalated
+            max_compression_ratio: Segments with a higher compression ratio (repetition) are escalated
+            max_no_speech_prob: Segments more likely than this to be non-speech are escalated
+            span_padding: Seconds of context added around an escalated span
+            whole_clip_fraction: Share of the clip above which the whole clip is escalated
+        """
+        self.model = model
+        self.min_logprob = min_logprob
+        self.max_compression_ratio = max_compression_ratio
+        self.max_no_speech_prob = max_no_speech_prob
+        self.span_padding = span_padding
+        self.whole_clip_fraction = whole_clip_fraction
+        self._lock = Lock()
+
+        # Escalation metrics for tuning the thresholds
+        self.clips = 0
+        self.escalated_clips = 0
+        self.whole_clips = 0
+        self.segments = 0
+        self.escalated_segments = 0
+        self.audio_seconds = 0.0
+        self.escalated_seconds = 0.0
+
+    def is_low_confidence(self, segment: Any) -> bool:
+        """Whether a segment from the fast model should be decoded again."""
+        return (segment.avg_logprob < self.min_logprob
+                or segment.compression_ratio > self.max_compression_ratio
+                or segment.no_speech_prob > self.max_no_speech_prob)
+
+    def decode(self, first_pass: Callable[[], list], redecode: Callable[[float, float], list],
+               duration: float) -> list:
+        """
+        Decode a clip with the fast model and escalate its unreliable parts.
+
+        Args:
+            first_pass: Decodes the whole clip with the fast model
+            redecode: Decodes the clip between two times in seconds with the larger model,
+                returning segments with timestamps relative to the start time
+            duration: Length of the clip in seconds
+
+        Returns:
+            List of segments in clip order
+        """
+        segments = first_pass()
+        low = [self.is_low_confidence(segment) for segment in segments]
+
+        spans = []
+        index = 0
+        while index < len(segments):
+            if not low[index]:
+                index += 1
+                continue
+            first = index
+            while index < len(segments) and low[index]:
+                index += 1
+            # Pad the run of unreliable segments, but not into the confident ones around it
+            before = segments[first - 1].end if first > 0 else 0.0
+            after = segments[index].start if index < len(segments) else duration
+            start = max(before, segments[first].start - self.span_padding, 0.0)
+            end = min(after, segments[index - 1].end + self.span_padding, duration)
+            spans.append((first, index, start, end))
+
+        escalated_seconds = sum(end - start for _, _, start, end in spans)
+        whole_clip = bool(spans) and escalated_seconds > duration * self.whole_clip_fraction
+        if whole_clip:
+            result = redecode(0.0, duration)
+            escalated_seconds = duration
+        else:
+            result = []
+            done = 0
+            for first, stop, start, end in spans:
+                result.extend(segments[done:first])
+                result.extend(_shift(segment, start) for segment in redecode(start, end))
+                done = stop
+            result.extend(segments[done:])
+
+        self._record(len(segments), sum(low), duration, escalated_seconds, whole_clip)
+        return result
+
+    def _record(self, segments: int, escalated: int, duration: float, escalated_seconds: float,
+                whole_clip: bool) -> None:
+        """Update and log the escalation metrics."""
+        with self._lock:
+            self.clips += 1
+            self.segments += segments
+            self.escalated_segments += escalated
+            self.audio_seconds += duration
+            if escalated:
+                self.escalated_clips += 1
+                self.whole_clips += whole_clip
+                self.escalated_seconds += escalated_seconds
+            summary = self.summary()
+
+        if escalated:
+            scope = "whole clip" if whole_clip else f"{escalated_seconds:.1f}s of {duration:.1f}s"
+            logger.info(f"Escalated {escalated} of {segments} segments to {self.model} ({scope}); {summary}")
+        else:
+            logger.debug(f"No escalation needed; {summary}")
+
+    def summary(self) -> str:
+        """One-line description of the escalation rates for the log."""
+        clip_rate = self.escalated_clips / self.clips if self.clips else 0.0
+        segment_rate = self.escalated_segments / self.segments if self.segments else 0.0
+        audio_rate = self.escalated_seconds / self.audio_seconds if self.audio_seconds else 0.0
+        return (f"escalated {self.escalated_clips}/{self.clips} clips ({clip_rate:.0%}, "
+                f"{self.whole_clips} whole), {segment_rate:.0%} of segments, {audio_rate:.0%} of audio")
@@ -0,0 +1,52 @@
+#app/core/decode_profiles.py
+
+import copy
+import logging
+from typing import Any, Dict, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Options shared by every profile
+COMMON_OPTIONS: Dict[str, Any] = {
+    'vad_filter': True,
+    'vad_parameters': {'min_silence_duration_ms': 500},
+}
+
+# Named sets of WhisperModel.transcribe options
+DECODE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Greedy decoding of the text only: no beam search, no word alignment,
+    # no timestamp tokens and no temperature fallback retries
+    'fast': {
+        'beam_size': 1,
+        'best_of': 1,
+        'temperature': 0.0,
+        'word_timestamps': False,
+        'without_timestamps': True,
+    },
+    # Beam search with word timestamps and temperature fallback
+    'accurate': {
+        'beam_size': 5,
+        'word_timestamps': True,
+    },
+}
+
+DEFAULT_PROFILE = 'fast'
+
+def profile_options(name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the transcribe options of a decode profile.
+
+    Args:
+        name: Profile name, defaults to DEFAULT_PROFILE
+
+    Returns:
+        New dictionary of WhisperModel.transcribe keyword arguments
+    """
+    name = name or DEFAULT_PROFILE
+    if name not in DECODE_PROFILES:
+        logger.warning(f"Unknown decode profile {name!r}, using {DEFAULT_PROFILE!r}")
+        name = DEFAULT_PROFILE
+    options = copy.deepcopy(COMMON_OPTIONS)
+    options.update(copy.deepcopy(DECODE_PROFILES[name]))
+    return options
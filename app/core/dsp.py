@@ -0,0 +1,197 @@
+#app/core/dsp.py
+
+import logging
+from functools import lru_cache
+from math import gcd
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Whisper models expect 16 kHz mono float32 audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Output samples computed per vectorized step, bounds temporary memory
+_RESAMPLE_CHUNK = 16384
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert captured audio to mono float32 in the range [-1, 1].
+
+    Args:
+        audio: Audio shaped (frames,) or (frames, channels), int16 or float
+
+    Returns:
+        1-D float32 array
+    """
+    if audio.ndim == 2 and audio.shape[1] == 1:
+        audio = audio[:, 0]
+    if audio.dtype == np.int16:
+        # Scale before any channel mean, which would turn the samples into float64
+        audio = audio.astype(np.float32) / 32768.0
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1)
+    return audio.astype(np.float32, copy=False)
+
+def synthetic_speech(seconds: float, sample_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """
+    Generate a deterministic speech-like test signal.
+
+    A harmonic tone with a wandering pitch, shaped into syllables at about
+    four per second, over a little noise.
+
+    Args:
+        seconds: Length of the signal
+        sample_rate: Sample rate of the signal
+
+    Returns:
+        1-D float32 array
+    """
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 140.0 + 30.0 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    syllables = 0.5 * (1.0 + np.sin(2 * np.pi * 4.0 * t))
+    noise = np.random.default_rng(0).standard_normal(len(t))
+    return (0.1 * voiced * syllables + 0.005 * noise).astype(np.float32)
+
+@lru_cache(maxsize=8)
+def _polyphase_filter(up: int, down: int, taps_per_phase: int, beta: float) -> np.ndarray:
+    """
+    Design a Kaiser-windowed sinc low-pass filter split into polyphase components.
+
+    Returns:
+        Array shaped (up, taps_per_phase) where row p holds h[p], h[p + up], ...
+    """
+    num_taps = up * taps_per_phase
+    cutoff = 0.5 / max(up, down)
+    t = np.arange(num_taps) - (num_taps - 1) / 2
+    h = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(num_taps, beta) * up
+    return np.ascontiguousarray(h.reshape(taps_per_phase, up).T, dtype=np.float32)
+
+class StreamingResampler:
+    """Incremental polyphase resampler for converting audio block by block."""
+
+    def __init__(self, orig_sr: int, target_sr: int, taps_per_phase: int = 48, beta: float = 8.0):
+        """
+        Initialize the resampler.
+
+        Args:
+            orig_sr: Sample rate of the input blocks
+            target_sr: Desired output sample rate
+            taps_per_phase: Filter length per polyphase branch
+            beta: Kaiser window shape parameter
+        """
+        g = gcd(orig_sr, target_sr)
+        self.up, self.down = target_sr // g, orig_sr // g
+        self.taps_per_phase = taps_per_phase
+        self._filter = _polyphase_filter(self.up, self.down, taps_per_phase, beta)
+        self._taps = np.arange(taps_per_phase)
+        # Shift by the filter's group delay so output sample 0 lines up with input sample 0
+        self._offset = (self.up * taps_per_phase - 1) // 2
+
+        # Input samples still needed by future outputs; zeros stand in for audio before the start
+        self._history = np.zeros(taps_per_phase, dtype=np.float32)
+        self._history_start = -taps_per_phase
+        self._consumed = 0
+        self._next_out = 0
+
+    def _compute(self, buf: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Compute output samples [start, end) from `buf`, which begins at the history start."""
+        out = np.empty(max(0, end - start), dtype=np.float32)
+        for chunk_start in range(start, end, _RESAMPLE_CHUNK):
+            n = np.arange(chunk_start, min(chunk_start + _RESAMPLE_CHUNK, end))
+            base, phase = np.divmod(n * self.down + self._offset, self.up)
+            window = buf[base[:, None] - self._taps[None, :] - self._history_start]
+            out[chunk_start - start:chunk_start - start + len(n)] = np.einsum('ij,ij->i', window, self._filter[phase])
+        return out
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of input.
+
+        Args:
+            block: 1-D float32 audio following the previously processed block
+
+        Returns:
+            All output samples that can be computed so far
+        """
+        if self.up == self.down:
+            return block
+        buf = np.concatenate((self._history, block))
+        self._consumed += len(block)
+
+        # Outputs whose newest input sample has already arrived
+        end = -(-(self._consumed * self.up - self._offset) // self.down)
+        out = self._compute(buf, self._next_out, end)
+        self._next_out = max(self._next_out, end)
+
+        keep_from = (self._next_out * self.down + self._offset) // self.up - (self.taps_per_phase - 1)
+        keep_from = min(max(keep_from, self._history_start), self._consumed)
+        self._history = buf[keep_from - self._history_start:].copy()
+        self._history_start = keep_from
+        return out
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the remaining output samples after the last block.
+
+        Returns:
+            Tail of the output, computed as if the input were followed by silence
+        """
+        if self.up == self.down:
+            return np.empty(0, dtype=np.float32)
+        total = -(-self._consumed * self.up // self.down)
+        buf = np.concatenate((self._history, np.zeros(self.taps_per_phase, dtype=np.float32)))
+        out = self._compute(buf, self._next_out, total)
+        self._next_out = max(self._next_out, total)
+        return out
+
+def resample_poly(audio: np.ndarray, orig_sr: int, target_sr: int,
+                  taps_per_phase: int = 48, beta: float = 8.0) -> np.ndarray:
+    """
+    Resample 1-D float audio with a vectorized polyphase FIR filter.
+
+    Args:
+        audio: 1-D float32 audio
+        orig_sr: Sample rate of the input
+        target_sr: Desired sample rate
+        taps_per_phase: Filter length per polyphase branch
+        beta: Kaiser window shape parameter
+
+    Returns:
+        Resampled 1-D float32 audio, time-aligned with the input
+    """
+    if orig_sr == target_sr:
+        return audio
+    resampler = StreamingResampler(orig_sr, target_sr, taps_per_phase, beta)
+    head = resampler.process(audio.astype(np.float32, copy=False))
+    return np.concatenate((head, resampler.flush()))
+
+def to_int16(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert float audio in [-1, 1] back to int16 samples.
+
+    Args:
+        audio: Float audio
+
+    Returns:
+        int16 array with the same shape
+    """
+    return np.clip(audio * 32768.0, -32768, 32767).astype(np.int16)
+
+def prepare_for_model(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Convert captured audio into the 16 kHz mono float32 array Whisper consumes.
+
+    Args:
+        audio: Captured audio
+        sample_rate: Sample rate of the captured audio
+
+    Returns:
+        Model-ready 1-D float32 array
+    """
+    audio = to_float32(audio)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio = resample_poly(audio, sample_rate, WHISPER_SAMPLE_RATE)
+    return audio
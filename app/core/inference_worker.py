@@ -0,0 +1,244 @@
+#app/core/inference_worker.py
+
+import logging
+import multiprocessing
+import signal
+import time
+from threading import Lock
+from typing import Any, Tuple
+
+from app.core.shared_audio import AudioHandle
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def _worker_main(conn) -> None:
+    """
+    Entry point of the inference process: own the model and serve requests over `conn`.
+
+    Requests are tuples whose first item is the command:
+        ('load',) loads the model
+        ('transcribe', audio, options) decodes audio and replies with (segments, info);
+            options may name the model to use in 'model_name'
+        ('transcribe_shared', handle, options) decodes audio mapped from an AudioHandle
+        ('shutdown',) exits
+    Every request gets a reply of ('ok', payload) or ('error', message).
+    """
+    # The app process handles Ctrl+C and decides when this process exits
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from utils.logger import log_dir, log_file
+    log_dir.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - inference-worker - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.FileHandler(str(log_file))],
+        # Replace any handlers inherited from modules imported by the spawned interpreter
+        force=True
+    )
+
+    from app.common.settings import load_settings
+    from app.core.dsp import WHISPER_SAMPLE_RATE, prepare_for_model
+    from app.core.model_cache import create_model_cache
+    from app.core.shared_audio import attach
+    from app.models.model_manager import ModelManager
+    settings = load_settings()
+    model_manager = ModelManager()
+    # Idle models are not unloaded here: the app stops this whole process instead
+    model_cache = create_model_cache(model_manager, settings)
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            # App process is gone
+            break
+
+        command = request[0]
+        if command == 'shutdown':
+            conn.send(('ok', None))
+            break
+
+        try:
+            if command == 'load':
+                model_cache.get_model()
+                conn.send(('ok', None))
+            elif command in ('transcribe', 'transcribe_shared'):
+                _, source, options = request
+                if command == 'transcribe_shared':
+                    # The app process owns the memory and frees it after our reply,
+                    # so the mapping is dropped as soon as the audio is converted
+                    view, detach = attach(source)
+                    try:
+                        audio = prepare_for_model(view, source.sample_rate)
+                    finally:
+                        del view
+                        detach()
+                else:
+                    audio = source
+                model_name = options.pop('model_name', None)
+                model = model_cache.get_model(model_name)
+                model_cache.begin_decode(model_name)
+                try:
+                    started = time.perf_counter()
+                    segments, info = model.transcribe(audio, **options)
+                    segments = list(segments)
+                    elapsed = time.perf_counter() - started
+                finally:
+                    model_cache.end_decode(model_name)
+                model_cache.record_decode(model_name, elapsed, len(audio) / WHISPER_SAMPLE_RATE)
+                conn.send(('ok', (segments, info)))
+            else:
+                conn.send(('error', f"Unknown command: {command}"))
+        except Exception as e:
+            logger.error(f"Error handling {command} request: {e}")
+            conn.send(('error', str(e)))
+
+class InferenceWorker:
+    """Client for a subprocess that hosts the Whisper model.
+
+    Keeping the model in its own process keeps long decodes away from the UI
+    and keyboard-listener threads, and unloading becomes terminating the
+    process, which returns all of its memory to the OS.
+    """
+
+    def __init__(self):
+        """Initialize the client; the process is started by start() or by the next request."""
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+        self._lock = Lock()
+        self.last_used: float = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker process is alive."""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the worker process if it is not already running."""
+        with self._lock:
+            self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        """Start the worker process; the caller holds the lock."""
+        if self.is_running:
+            return
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name="inference-worker",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        self.last_used = time.time()
+        logger.info(f"Started inference worker process {self._process.pid}")
+
+    def _request(self, *request) -> Any:
+        """Send a request and wait for its reply, restarting the worker if it died."""
+        with self._lock:
+            self._ensure_started()
+            try:
+                self._conn.send(request)
+                status, payload = self._conn.recv()
+            except (EOFError, OSError, BrokenPipeError) as e:
+                logger.error(f"Inference worker died: {e}")
+                self._terminate()
+                raise RuntimeError("Inference worker died") from e
+            self.last_used = time.time()
+
+        if status != 'ok':
+            raise RuntimeError(f"Inference worker error: {payload}")
+        return payload
+
+    def load(self) -> None:
+        """Load the model in the worker process."""
+        started = time.time()
+        self._request('load')
+        logger.info(f"Model ready in inference worker after {time.time() - started:.2f}s")
+
+    def transcribe(self, audio, **options) -> Tuple[list, Any]:
+        """
+        Decode audio in the worker process.
+
+        Args:
+            audio: 16 kHz mono float32 audio
+            **options: Keyword arguments for WhisperModel.transcribe
+
+        Returns:
+            Tuple of (list of segments, transcription info)
+        """
+        return self._request('transcribe', audio, options)
+
+    def transcribe_shared(self, handle: AudioHandle, **options) -> Tuple[list, Any]:
+        """
+        Decode captured audio the worker maps itself; only the handle is sent.
+
+        The memory behind the handle must stay valid until this returns.
+
+        Args:
+            handle: Handle to a slice of a shared recording buffer
+            **options: Keyword arguments for WhisperModel.transcribe
+
+        Returns:
+            Tuple of (list of segments, transcription info)
+        """
+        return self._request('transcribe_shared', handle, options)
+
+    def _terminate(self) -> None:
+        """Kill the worker process; the caller holds the lock."""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process.join(timeout=2.0)
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the worker process, freeing all memory held by the model.
+
+        Args:
+            timeout: Seconds to wait for a clean exit before terminating it
+        """
+        with self._lock:
+            self._shutdown(timeout)
+
+    def stop_if_idle(self, idle_seconds: float) -> bool:
+        """
+        Stop the worker process if it has not served a request for `idle_seconds`.
+
+        The next request starts it again.
+
+        Args:
+            idle_seconds: Seconds without requests after which the process is stopped
+
+        Returns:
+            True if the process was stopped
+        """
+        with self._lock:
+            if not self.is_running or time.time() - self.last_used < idle_seconds:
+                return False
+            self._shutdown()
+            return True
+
+    def _shutdown(self, timeout: float = 2.0) -> None:
+        """Ask the worker process to exit, terminating it if it does not; the caller holds the lock."""
+        if not self.is_running:
+            self._process = None
+            return
+        pid = self._process.pid
+        try:
+            self._conn.send(('shutdown',))
+            if self._conn.poll(timeout):
+                self._conn.recv()
+            self._process.join(timeout=timeout)
+        except (EOFError, OSError, BrokenPipeError):
+            pass
+        self._terminate()
+        logger.info(f"Stopped inference worker process {pid}")
@@ -0,0 +1,163 @@
+#app/core/language_lock.py
+
+import logging
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class LanguageLock:
+    """Decides which language to pass to Whisper so it can skip language detection.
+
+    Without `language=`, every decode first runs a language-ID pass over the
+    first 30 second window. A configured language is always passed. Otherwise,
+    in adaptive mode, the language is pinned after `lock_after` confident
+    detections of the same language in a row. A pinned language is detected
+    again every `recheck_every` decodes, since Whisper forced into the wrong
+    language often translates fluently, and is also released when a pinned
+    decode comes out with a low average log probability.
+    """
+
+    def __init__(self, language: Optional[str] = None, adaptive: bool = False, lock_after: int = 3,
+                 min_probability: float = 0.9, unlock_logprob: float = -1.0, recheck_every: int = 10):
+        """
+        Initialize the lock.
+
+        Args:
+            language: Language code to always use, None to detect it
+            adaptive: Pin the detected language after `lock_after` confident detections
+            lock_after: Confident detections of the same language in a row needed to pin it
+            min_probability: Detection probability that counts as confident
+            unlock_logprob: Average log probability below which a pinned language is released
+            recheck_every: Pinned decodes after which the language is detected again
+        """
+        self.configured = language
+        self.adaptive = adaptive
+        self.lock_after = max(1, lock_after)
+        self.min_probability = min_probability
+        self.unlock_logprob = unlock_logprob
+        self.recheck_every = max(1, recheck_every)
+        self.pinned: Optional[str] = language
+        self._candidate: Optional[str] = None
+        self._streak = 0
+        self._since_check = 0
+        self._lock = Lock()
+
+        # Counters for the log; decode times are kept per second of audio,
+        # so clips of different lengths can be compared
+        self.detections = 0
+        self.skipped = 0
+        self.unlocks = 0
+        self._detect_seconds = 0.0
+        self._detect_audio_seconds = 0.0
+        self._pinned_seconds = 0.0
+        self._pinned_audio_seconds = 0.0
+
+    def language(self) -> Optional[str]:
+        """Language to pass to the next decode, None to let Whisper detect it."""
+        with self._lock:
+            if self.pinned and not self.configured and self._since_check >= self.recheck_every:
+                # Time for a check that the pinned language is still the one spoken
+                return None
+            return self.pinned
+
+    def observe(self, info: Any, segments: Iterable[Any], seconds: float, audio_seconds: float,
+                detected: bool) -> None:
+        """
+        Update the lock with the outcome of a decode.
+
+        Args:
+            info: TranscriptionInfo returned by WhisperModel.transcribe
+            segments: Decoded segments
+            seconds: Wall time the decode took
+            audio_seconds: Duration of the decoded audio
+            detected: Whether Whisper detected the language itself in this decode
+        """
+        with self._lock:
+            if detected:
+                self._observe_detection(info, seconds, audio_seconds)
+            else:
+                self._observe_pinned(segments, seconds, audio_seconds)
+
+    def _observe_detection(self, info: Any, seconds: float, audio_seconds: float) -> None:
+        """Count a detection towards pinning its language; the caller holds the lock."""
+        self.detections += 1
+        self._detect_seconds += seconds
+        self._detect_audio_seconds += audio_seconds
+        if info is None or not self.adaptive or self.configured:
+            return
+
+        confident = info.language_probability >= self.min_probability
+        if self.pinned is not None:
+            # A periodic re-check of the pinned language
+            self._since_check = 0
+            if confident and info.language == self.pinned:
+                return
+            logger.info(f"Released pinned language {self.pinned}: re-check detected {info.language} "
+                        f"(p {info.language_probability:.2f}), detecting again ({self.summary()})")
+            self._release()
+            return
+
+        if not confident:
+            self._candidate, self._streak = None, 0
+            return
+        if info.language == self._candidate:
+            self._streak += 1
+        else:
+            self._candidate, self._streak = info.language, 1
+
+        if self._streak >= self.lock_after:
+            self.pinned = self._candidate
+            self._since_check = 0
+            logger.info(f"Pinned language {self.pinned} after {self._streak} confident detections "
+                        f"(p >= {self.min_probability:.2f}); skipping language detection")
+
+    def _observe_pinned(self, segments: Iterable[Any], seconds: float, audio_seconds: float) -> None:
+        """Release the pinned language if the decode looks wrong; the caller holds the lock."""
+        self.skipped += 1
+        self._pinned_seconds += seconds
+        self._pinned_audio_seconds += audio_seconds
+        if self.configured or self.pinned is None:
+            return
+        self._since_check += 1
+
+        # Average log probability of the decode, weighted by segment length
+        total = weight = 0.0
+        for segment in segments:
+            duration = max(segment.end - segment.start, 0.01)
+            total += segment.avg_logprob * duration
+            weight += duration
+        if not weight or total / weight >= self.unlock_logprob:
+            return
+
+        logger.info(f"Released pinned language {self.pinned}: average log probability {total / weight:.2f} "
+                    f"below {self.unlock_logprob:.2f}, detecting again ({self.summary()})")
+        self._release()
+
+    def _release(self) -> None:
+        """Go back to detecting the language on every decode; the caller holds the lock."""
+        self.pinned = None
+        self._candidate, self._streak = None, 0
+        self._since_check = 0
+        self.unlocks += 1
+
+    def saved_seconds(self) -> float:
+        """
+        Estimate the time saved by skipping language detection.
+
+        Returns:
+            Audio decoded with a pinned language times the difference in decode
+            time per second of audio with and without detection, 0.0 until both
+            have been seen
+        """
+        if not self._detect_audio_seconds or not self._pinned_audio_seconds:
+            return 0.0
+        per_audio_second = (self._detect_seconds / self._detect_audio_seconds
+                            - self._pinned_seconds / self._pinned_audio_seconds)
+        return max(0.0, per_audio_second) * self._pinned_audio_seconds
+
+    def summary(self) -> str:
+        """One-line description of the detection counters for the log."""
+        return (f"{self.detections} detections, {self.skipped} skipped, {self.unlocks} releases, "
+                f"~{self.saved_seconds():.1f}s saved")
@@ -0,0 +1,428 @@
+#app/core/model_cache.py
+
+import gc
+import logging
+import time
+from collections import OrderedDict, deque
+from threading import Event, Lock, Thread
+from typing import Any, Deque, Dict, List, Optional, Set
+import numpy as np
+import psutil
+from faster_whisper import WhisperModel
+from faster_whisper.vad import get_speech_timestamps
+
+from app.common.settings import load_calibration
+from app.core.dsp import synthetic_speech
+from app.core.model_catalog import get_catalog, managed_by_catalog, resolve_model
+from app.core.model_loader import READY, ModelLoader
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Pauses between uses of a model longer than this are recorded as idle gaps;
+# shorter ones are decode passes of the same recording
+IDLE_GAP_SECONDS = 60.0
+
+# Idle gaps remembered per model
+GAP_HISTORY = 20
+
+# Measured load sizes below this share of the catalog size are not trusted:
+# a reload reuses memory an earlier unload freed but never returned to the OS
+MIN_MEASURED_FRACTION = 0.5
+
+# Seconds a freshly loaded model waits for a real request before warming up;
+# a request within that time skips the warm-up instead of queueing behind it
+WARMUP_DELAY_SECONDS = 0.5
+
+def process_rss_mb() -> float:
+    """Return the resident memory of this process in MB."""
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+def warm_up_model(model: WhisperModel, seconds: float = 1.0) -> float:
+    """
+    Run a short synthetic decode and a VAD pass so lazy initialization happens now.
+
+    Args:
+        model: Freshly loaded model
+        seconds: Length of the synthetic clip
+
+    Returns:
+        Seconds the warm-up took
+    """
+    started = time.perf_counter()
+    clip = synthetic_speech(seconds)
+
+    # The Silero VAD used by vad_filter loads on first use
+    get_speech_timestamps(clip)
+    # Called directly without vad_filter so the decoder runs even if the clip counts as silence
+    segments, _ = model.transcribe(clip, beam_size=1, vad_filter=False, without_timestamps=True)
+    list(segments)
+    return time.perf_counter() - started
+
+class _Warmup:
+    """Background warm-up of one freshly loaded model, which the first real decode can skip."""
+
+    def __init__(self):
+        self.cancelled = Event()
+        self.started = False
+        self.succeeded = False
+        self.finished = Event()
+
+class CatalogModelSource:
+    """Loads one named model from the catalog for the cache.
+
+    Has the get_model/unload_model interface of ModelManager so it can sit
+    behind a ModelLoader like the active model does.
+    """
+
+    def __init__(self, model_manager, name: str, device: str = "cpu", compute_type: str = "int8",
+                 cpu_threads: int = 0, num_workers: int = 1):
+        """
+        Initialize the source.
+
+        Args:
+            model_manager: ModelManager providing the standard models
+            name: Catalog name of the model
+            device: Device passed to WhisperModel
+            compute_type: Compute type passed to WhisperModel
+            cpu_threads: Threads per decode, 0 lets CTranslate2 choose
+            num_workers: Decodes the model can run in parallel
+        """
+        self.model_manager = model_manager
+        self.current_model = name
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.model: Optional[WhisperModel] = None
+
+    def get_model(self) -> WhisperModel:
+        """Load the model if needed and return it."""
+        if self.model is None:
+            exists, location = resolve_model(self.model_manager, self.current_model)
+            if not exists:
+                raise FileNotFoundError(f"Model {self.current_model} is not downloaded")
+            self.model = WhisperModel(location, device=self.device, compute_type=self.compute_type,
+                                      cpu_threads=self.cpu_threads, num_workers=self.num_workers)
+        return self.model
+
+    def unload_model(self) -> None:
+        """Drop the model so its memory can be reclaimed."""
+        self.model = None
+        gc.collect()
+
+class ModelCache:
+    """Keeps several loaded Whisper models under a memory budget, evicting the least recently used."""
+
+    def __init__(self, model_manager, model_loader: ModelLoader, budget_mb: float, warmup: bool = False,
+                 load_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            model_manager: ModelManager owning the active model and the catalog
+            model_loader: Loader for the active model
+            budget_mb: Memory all cached models together may use
+            warmup: Run a short background warm-up decode after each load
+            load_options: WhisperModel options for the other models, e.g. from calibration
+        """
+        self.model_manager = model_manager
+        self.load_options = dict(load_options or {})
+        self.budget_mb = budget_mb
+        self._default_name = model_manager.current_model
+        self._loaders: Dict[str, ModelLoader] = {self._default_name: model_loader}
+        self._sizes_mb: Dict[str, float] = {}
+        # Loaded models, least recently used first
+        self._lru: "OrderedDict[str, float]" = OrderedDict()
+        # Usage history, kept across evictions
+        self._last_used: Dict[str, float] = {}
+        self._gaps: Dict[str, Deque[float]] = {}
+        # Decodes running per model; a model is never evicted in the middle of one
+        self._in_flight: Dict[str, int] = {}
+        # Models used together with the active one, which never evict it
+        self._companions: Set[str] = set()
+        self._lock = Lock()
+        
+        # First decode after each load, timed to show what warming up saves;
+        # None if there was no warm-up
+        self.warmup = warmup
+        self._warmups: Dict[str, _Warmup] = {}
+        self._first_decode: Dict[str, Optional[_Warmup]] = {}
+        self.first_decode_rtf: Dict[str, List[float]] = {'warm': [], 'cold': []}
+
+    def _loader(self, name: str) -> ModelLoader:
+        """Return the loader for a model, creating it on first use."""
+        with self._lock:
+            loader = self._loaders.get(name)
+            if loader is None:
+                loader = ModelLoader(CatalogModelSource(self.model_manager, name, **self.load_options))
+                self._loaders[name] = loader
+            return loader
+
+    def estimated_size_mb(self, name: str) -> float:
+        """Memory a model is expected to use: measured on its first plausible load, else the catalog size."""
+        if name in self._sizes_mb:
+            return self._sizes_mb[name]
+        return self._catalog_size(name)
+
+    @property
+    def used_mb(self) -> float:
+        """Estimated memory used by the loaded models."""
+        with self._lock:
+            loaded = list(self._lru)
+        return sum(self.estimated_size_mb(name) for name in loaded)
+
+    def loaded_models(self) -> list:
+        """Names of the loaded models, least recently used first."""
+        with self._lock:
+            return list(self._lru)
+
+    def last_used(self) -> Dict[str, float]:
+        """Time each loaded model was last requested."""
+        with self._lock:
+            return dict(self._lru)
+
+    def idle_gaps(self, name: str) -> List[float]:
+        """Recent idle gaps in seconds between uses of a model, oldest first."""
+        with self._lock:
+            return list(self._gaps.get(name, ()))
+
+    def get_model(self, name: Optional[str] = None) -> WhisperModel:
+        """
+        Return a loaded model, evicting others if loading it would exceed the budget.
+
+        Args:
+            name: Catalog name of the model, defaults to the active model
+
+        Returns:
+            The WhisperModel instance
+        """
+        name = name or self._default_name
+        loader = self._loader(name)
+
+        if loader.state != READY:
+            self._make_room(name)
+
+        rss_before = process_rss_mb()
+        model, loaded = loader.get_model()
+        if loaded:
+            # Only the call that did the load measures it and starts the warm-up
+            delta = process_rss_mb() - rss_before
+            # Other threads allocate and free too, so keep the first plausible measurement
+            if name not in self._sizes_mb and delta > 0 and delta >= self._catalog_size(name) * MIN_MEASURED_FRACTION:
+                self._sizes_mb[name] = delta
+            logger.info(f"Model {name} uses ~{self.estimated_size_mb(name):.0f}MB "
+                        f"(catalog {self._catalog_size(name):.0f}MB, measured {delta:.0f}MB)")
+            
+            warmup = _Warmup() if self.warmup else None
+            with self._lock:
+                self._first_decode[name] = warmup
+                if warmup is not None:
+                    self._warmups[name] = warmup
+            if warmup is not None:
+                # Off the caller's path, and only if no real decode starts first (see begin_decode)
+                Thread(target=self._warm_up, args=(name, model, warmup),
+                       name=f"warmup-{name}", daemon=True).start()
+
+        now = time.time()
+        with self._lock:
+            previous = self._last_used.get(name)
+            if previous is not None and now - previous >= IDLE_GAP_SECONDS:
+                self._gaps.setdefault(name, deque(maxlen=GAP_HISTORY)).append(now - previous)
+            self._last_used[name] = now
+            self._lru[name] = now
+            self._lru.move_to_end(name)
+        return model
+
+    def _warm_up(self, name: str, model: WhisperModel, warmup: _Warmup) -> None:
+        """Warm up a freshly loaded model unless a real decode claims it first."""
+        if warmup.cancelled.wait(WARMUP_DELAY_SECONDS):
+            return
+        with self._lock:
+            if warmup.cancelled.is_set():
+                return
+            warmup.started = True
+
+        try:
+            logger.info(f"Warmed up model {name} in {warm_up_model(model):.2f}s")
+            warmup.succeeded = True
+        except Exception as e:
+            logger.error(f"Error warming up model {name}: {e}")
+        finally:
+            warmup.finished.set()
+            with self._lock:
+                if self._warmups.get(name) is warmup:
+                    del self._warmups[name]
+
+    def begin_decode(self, name: Optional[str] = None) -> None:
+        """
+        Call right before decoding with a model, and end_decode once it is done.
+
+        Marks the model as in use, so it is not evicted during a long decode,
+        and keeps its warm-up from competing with the decode.
+
+        A warm-up that has not started yet is skipped. One that is already
+        running is waited for here, because decodes of a model with one worker
+        run one at a time anyway; the wait is logged and kept out of the
+        first-decode timing.
+
+        Args:
+            name: Catalog name of the model, None for the active model
+        """
+        name = name or self._default_name
+        with self._lock:
+            self._in_flight[name] = self._in_flight.get(name, 0) + 1
+            warmup = self._warmups.pop(name, None)
+            if warmup is None:
+                return
+            warmup.cancelled.set()
+            running = warmup.started
+
+        if not running:
+            logger.info(f"Skipped warm-up of model {name}, a decode arrived first")
+            return
+        started = time.perf_counter()
+        warmup.finished.wait()
+        logger.info(f"First decode with model {name} waited {time.perf_counter() - started:.2f}s "
+                    f"for its warm-up to finish")
+
+    def end_decode(self, name: Optional[str] = None) -> None:
+        """
+        Call when a decode started with begin_decode has finished or failed.
+
+        Args:
+            name: Catalog name of the model, None for the active model
+        """
+        name = name or self._default_name
+        now = time.time()
+        with self._lock:
+            remaining = self._in_flight.get(name, 0) - 1
+            if remaining > 0:
+                self._in_flight[name] = remaining
+            else:
+                self._in_flight.pop(name, None)
+            # Idle time starts when the decode ends, not when it started
+            if name in self._lru:
+                self._lru[name] = now
+                self._last_used[name] = now
+
+    def record_decode(self, name: Optional[str], seconds: float, audio_seconds: float) -> None:
+        """
+        Report how long a decode took, so the first one after each load can be compared.
+
+        Args:
+            name: Catalog name of the model used, None for the active model
+            seconds: Time the decode took
+            audio_seconds: Duration of the decoded audio
+        """
+        name = name or self._default_name
+        with self._lock:
+            if name not in self._first_decode:
+                return
+            warmup = self._first_decode.pop(name)
+
+        kind = 'warm' if warmup is not None and warmup.succeeded else 'cold'
+        rtf = seconds / max(audio_seconds, 1e-3)
+        self.first_decode_rtf[kind].append(rtf)
+        averages = ", ".join(f"{k} average {np.mean(v):.3f} over {len(v)}"
+                             for k, v in self.first_decode_rtf.items() if v)
+        logger.info(f"First decode after loading {name} ({kind}): {seconds:.2f}s for "
+                    f"{audio_seconds:.1f}s of audio, real-time factor {rtf:.3f} ({averages})")
+
+    def _catalog_size(self, name: str) -> float:
+        """Catalog size of a model in MB, 0 if unknown."""
+        try:
+            return float(get_catalog(self.model_manager)[name]['size_mb'])
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+
+    def add_companion(self, name: str) -> None:
+        """
+        Keep the active model loaded whenever `name` is loaded, e.g. the cascade model.
+
+        Args:
+            name: Catalog name of a model used together with the active model
+        """
+        with self._lock:
+            self._companions.add(name)
+        combined = self.estimated_size_mb(self._default_name) + self.estimated_size_mb(name)
+        if combined > self.budget_mb:
+            logger.warning(f"Models {self._default_name} and {name} need ~{combined:.0f}MB together, more "
+                           f"than the {self.budget_mb:.0f}MB model_memory_budget_mb; both stay loaded anyway")
+
+    def _make_room(self, name: str) -> None:
+        """Evict least recently used models until `name` fits in the budget."""
+        needed = self.estimated_size_mb(name)
+        while True:
+            with self._lock:
+                keep = {name} | set(self._in_flight)
+                if name in self._companions:
+                    keep.add(self._default_name)
+                others = [loaded for loaded in self._lru if loaded not in keep]
+            if not others or self.used_mb + needed <= self.budget_mb:
+                return
+            logger.info(f"Evicting model {others[0]} to make room for {name} "
+                        f"({self.used_mb:.0f}MB used, {needed:.0f}MB needed, {self.budget_mb:.0f}MB budget)")
+            self.evict(others[0])
+
+    def evict(self, name: str, last_used: Optional[float] = None) -> bool:
+        """
+        Unload a model and forget it was loaded.
+
+        Args:
+            name: Catalog name of the model
+            last_used: Only evict if the model has not been used since this time
+
+        Returns:
+            False if the model was used again or is decoding, and kept
+        """
+        with self._lock:
+            if last_used is not None and self._lru.get(name) != last_used:
+                return False
+            if name in self._in_flight:
+                return False
+            self._lru.pop(name, None)
+            loader = self._loaders.get(name)
+        if loader is not None:
+            loader.unload()
+        return True
+
+    def unload_all(self) -> None:
+        """Unload every cached model."""
+        for name in self.loaded_models():
+            self.evict(name)
+
+def create_model_cache(model_manager, settings: Dict[str, Any]) -> ModelCache:
+    """
+    Build the model cache from the app settings.
+
+    When a calibration exists, every model including the active one is built
+    with the calibrated options. Otherwise ModelManager loads the active model,
+    unless it is a catalog variant or was provisioned in the local models directory.
+    Loading the cascade model never evicts the active model.
+
+    Args:
+        model_manager: ModelManager owning the active model and the catalog
+        settings: Settings from load_settings()
+
+    Returns:
+        The configured cache
+    """
+    load_options = load_calibration()
+    if load_options:
+        logger.info(f"Loading models with calibrated options {load_options}")
+    if load_options or managed_by_catalog(model_manager.current_model):
+        source = CatalogModelSource(model_manager, model_manager.current_model, **(load_options or {}))
+    else:
+        source = model_manager
+    cache = ModelCache(
+        model_manager,
+        ModelLoader(source),
+        settings['model_memory_budget_mb'],
+        warmup=settings['model_warmup'],
+        load_options=load_options
+    )
+    if settings['cascade_model']:
+        # Escalations must not push out the fast model the next clip starts with
+        cache.add_companion(settings['cascade_model'])
+    return cache
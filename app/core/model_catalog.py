@@ -0,0 +1,155 @@
+#app/core/model_catalog.py
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from faster_whisper.utils import download_model
+
+from utils.file_utils import get_app_directory
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Directory in the app directory holding models provisioned by hand, one
+# CTranslate2 model directory per catalog name, e.g. models/distil-large-v3
+LOCAL_MODELS_DIR = "models"
+
+# Decoding speed relative to large (1.0) for the models ModelManager offers
+RELATIVE_SPEED: Dict[str, float] = {
+    'tiny': 10.0,
+    'base': 7.0,
+    'small': 4.0,
+    'medium': 2.0,
+    'large': 1.0,
+}
+
+# Models offered on top of ModelManager's catalog. English-only models are
+# faster and more accurate for English than their multilingual siblings;
+# distilled models keep the large encoder with a much smaller decoder.
+MODEL_VARIANTS: Dict[str, Dict[str, Any]] = {
+    'tiny.en': {'size_mb': 75, 'speed': 'Very Fast', 'accuracy': 'Basic', 'relative_speed': 10.0,
+                'english_only': True, 'repo': 'Systran/faster-whisper-tiny.en'},
+    'base.en': {'size_mb': 145, 'speed': 'Very Fast', 'accuracy': 'Good', 'relative_speed': 7.0,
+                'english_only': True, 'repo': 'Systran/faster-whisper-base.en'},
+    'small.en': {'size_mb': 484, 'speed': 'Fast', 'accuracy': 'Better', 'relative_speed': 4.0,
+                 'english_only': True, 'repo': 'Systran/faster-whisper-small.en'},
+    'medium.en': {'size_mb': 1530, 'speed': 'Moderate', 'accuracy': 'Very Good', 'relative_speed': 2.0,
+                  'english_only': True, 'repo': 'Systran/faster-whisper-medium.en'},
+    'distil-small.en': {'size_mb': 336, 'speed': 'Very Fast', 'accuracy': 'Better', 'relative_speed': 5.6,
+                        'english_only': True, 'repo': 'Systran/faster-distil-whisper-small.en'},
+    'distil-medium.en': {'size_mb': 789, 'speed': 'Fast', 'accuracy': 'Very Good', 'relative_speed': 6.8,
+                         'english_only': True, 'repo': 'Systran/faster-distil-whisper-medium.en'},
+    'distil-large-v3': {'size_mb': 1510, 'speed': 'Fast', 'accuracy': 'Very Good', 'relative_speed': 6.3,
+                        'english_only': True, 'repo': 'Systran/faster-distil-whisper-large-v3'},
+    'large-v3-turbo': {'size_mb': 1620, 'speed': 'Fast', 'accuracy': 'Best', 'relative_speed': 8.0,
+                       'english_only': False, 'repo': 'mobiuslabsgmbh/faster-whisper-large-v3-turbo'},
+}
+
+def get_catalog(model_manager) -> Dict[str, Dict[str, Any]]:
+    """
+    List every model that can be selected.
+
+    Args:
+        model_manager: ModelManager providing the standard models
+
+    Returns:
+        Dictionary of model name to size_mb, speed, accuracy, relative_speed
+        and english_only, standard models first
+    """
+    catalog = {}
+    for name, info in model_manager.get_available_models().items():
+        catalog[name] = dict(info, relative_speed=RELATIVE_SPEED.get(name, 1.0), english_only=False)
+    for name, info in MODEL_VARIANTS.items():
+        catalog.setdefault(name, dict(info))
+    return catalog
+
+def local_model_path(name: str) -> Optional[Path]:
+    """
+    Return the hand-provisioned directory of a model, if there is one.
+
+    Args:
+        name: Catalog name of the model
+
+    Returns:
+        Path to a directory containing model.bin, or None
+    """
+    path = get_app_directory() / LOCAL_MODELS_DIR / name
+    return path if (path / "model.bin").exists() else None
+
+def managed_by_catalog(name: str) -> bool:
+    """Whether the model is loaded from this catalog rather than by ModelManager."""
+    return name in MODEL_VARIANTS or local_model_path(name) is not None
+
+def resolve_model(model_manager, name: str) -> Tuple[bool, str]:
+    """
+    Find a model on disk without touching the network.
+
+    Looks in the local models directory first, then in the Hugging Face cache
+    for variants and through ModelManager for the standard models.
+
+    Args:
+        model_manager: ModelManager providing the standard models
+        name: Catalog name of the model
+
+    Returns:
+        Tuple of (exists, location)
+    """
+    path = local_model_path(name)
+    if path is not None:
+        return True, str(path)
+
+    if name in MODEL_VARIANTS:
+        try:
+            return True, download_model(MODEL_VARIANTS[name]['repo'], local_files_only=True)
+        except Exception:
+            return False, ""
+
+    return model_manager.check_model_location(name)
+
+def check_disk_space(model_manager, name: str) -> Tuple[bool, str]:
+    """
+    Check there is room to download a model.
+
+    Args:
+        model_manager: ModelManager providing the standard models
+        name: Catalog name of the model
+
+    Returns:
+        Tuple of (has_space, message)
+    """
+    if name not in MODEL_VARIANTS:
+        return model_manager.check_disk_space(name)
+
+    needed_mb = MODEL_VARIANTS[name]['size_mb'] * 1.2
+    free_mb = shutil.disk_usage(Path.home()).free / (1024 * 1024)
+    if free_mb < needed_mb:
+        return False, f"Not enough disk space: {needed_mb:.0f}MB needed, {free_mb:.0f}MB free"
+    return True, "Enough disk space available"
+
+def download(model_manager, name: str,
+             progress_callback: Optional[Callable[[float], None]] = None) -> Tuple[bool, str]:
+    """
+    Download a model into the Hugging Face cache and make it the active model.
+
+    Args:
+        model_manager: ModelManager providing the standard models
+        name: Catalog name of the model
+        progress_callback: Called with the download progress between 0 and 1
+
+    Returns:
+        Tuple of (success, message)
+    """
+    if name not in MODEL_VARIANTS:
+        return model_manager.download_model(name, progress_callback)
+
+    try:
+        download_model(MODEL_VARIANTS[name]['repo'])
+    except Exception as e:
+        logger.error(f"Error downloading model {name}: {e}")
+        return False, f"Download failed: {e}"
+
+    if progress_callback:
+        progress_callback(1.0)
+    model_manager.set_active_model(name)
+    return True, f"Model {name} downloaded successfully"
@@ -0,0 +1,130 @@
+#app/core/model_loader.py
+
+import logging
+import time
+from threading import Condition
+from typing import Any, Dict, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Load states
+UNLOADED = 'unloaded'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+
+# A get_model call on a ready model slower than this was a reload after an
+# unload done inside ModelManager (its idle timeout)
+RELOAD_DETECT_SECONDS = 0.25
+
+class ModelLoader:
+    """Single-flight, thread-safe front for ModelManager loads.
+
+    However many threads ask for the model at once, only one load runs; the
+    others wait for it and share the result.
+    """
+
+    def __init__(self, model_manager):
+        """
+        Initialize the loader.
+
+        Args:
+            model_manager: ModelManager that performs the actual loads
+        """
+        self.model_manager = model_manager
+        self._condition = Condition()
+        self._busy = False
+        self.state: str = UNLOADED
+        self.last_error: Optional[str] = None
+
+        # Metrics
+        self.loads = 0
+        self.failures = 0
+        self.coalesced = 0
+        self.last_load_seconds: Optional[float] = None
+        self.total_load_seconds = 0.0
+
+    def _acquire(self) -> bool:
+        """
+        Wait until no other call is using the model manager and claim it.
+
+        Returns:
+            True if the caller had to wait for a load in flight
+        """
+        waited = False
+        with self._condition:
+            while self._busy:
+                waited = waited or self.state == LOADING
+                self._condition.wait()
+            self._busy = True
+        return waited
+
+    def _release(self, state: str) -> None:
+        """Publish the new state and wake the waiting callers."""
+        with self._condition:
+            self.state = state
+            self._busy = False
+            self._condition.notify_all()
+
+    def get_model(self) -> Tuple[Any, bool]:
+        """
+        Return the loaded model, loading it if needed.
+
+        Returns:
+            Tuple of (WhisperModel instance, whether this call loaded it); callers
+            that waited for another thread's load get False
+
+        Raises:
+            The error from ModelManager.get_model; callers waiting on a failed
+            load then try once more themselves
+        """
+        waited = self._acquire()
+        if waited:
+            self.coalesced += 1
+        was_ready = self.state == READY
+        if not was_ready:
+            with self._condition:
+                self.state = LOADING
+
+        started = time.perf_counter()
+        try:
+            model = self.model_manager.get_model()
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            logger.error(f"Model load failed after {time.perf_counter() - started:.2f}s: {e}")
+            self._release(FAILED)
+            raise
+
+        elapsed = time.perf_counter() - started
+        loaded = not was_ready or elapsed >= RELOAD_DETECT_SECONDS
+        if loaded:
+            self.loads += 1
+            self.last_load_seconds = elapsed
+            self.total_load_seconds += elapsed
+            self.last_error = None
+            logger.info(f"Model {self.model_manager.current_model} loaded in {elapsed:.2f}s (load #{self.loads})")
+        self._release(READY)
+        return model, loaded
+
+    def unload(self) -> None:
+        """Unload the model, waiting for a load in flight to finish first."""
+        self._acquire()
+        try:
+            self.model_manager.unload_model()
+        finally:
+            self._release(UNLOADED)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the load state and timing metrics."""
+        with self._condition:
+            return {
+                'state': self.state,
+                'loads': self.loads,
+                'failures': self.failures,
+                'coalesced': self.coalesced,
+                'last_load_seconds': self.last_load_seconds,
+                'average_load_seconds': self.total_load_seconds / self.loads if self.loads else None,
+                'last_error': self.last_error,
+            }
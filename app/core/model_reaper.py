@@ -0,0 +1,144 @@
+#app/core/model_reaper.py
+
+import logging
+import time
+from threading import Event, Thread
+from typing import Dict, Optional
+import numpy as np
+
+from app.core.inference_worker import InferenceWorker
+from app.core.model_cache import ModelCache
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Bounds on how often the reaper wakes up, in seconds
+MIN_WAKEUP_SECONDS = 5.0
+MAX_WAKEUP_SECONDS = 60.0
+
+# Idle gaps needed before the timeout adapts to them
+MIN_GAPS_FOR_ADAPTING = 3
+
+class IdleReaper:
+    """Background thread that unloads models once they have been idle long enough.
+
+    Each model has a base timeout. With adaptive timeouts, a model whose users
+    usually come back a little after the base timeout (bursts of dictation
+    during the working day) is kept until the time most of those returns
+    happen, up to `max_timeout`; a model used rarely keeps the base timeout.
+    With an inference worker, the worker process is stopped once it has been
+    idle for the base timeout, which returns all of its memory to the OS.
+    """
+
+    def __init__(self, cache: ModelCache, timeout: float, per_model: Optional[Dict[str, float]] = None,
+                 adaptive: bool = True, max_timeout: Optional[float] = None,
+                 inference_worker: Optional[InferenceWorker] = None):
+        """
+        Initialize the reaper.
+
+        Args:
+            cache: Cache holding the loaded models
+            timeout: Idle seconds after which a model is unloaded
+            per_model: Timeouts for individual models, overriding `timeout`
+            adaptive: Stretch timeouts to cover the observed gaps between uses
+            max_timeout: Longest an adaptive timeout may become, defaults to 4x the base
+            inference_worker: Worker process to stop when idle, if the model runs in one
+        """
+        self.cache = cache
+        self.timeout = timeout
+        self.per_model = dict(per_model or {})
+        self.adaptive = adaptive
+        self.max_timeout = max_timeout
+        self.inference_worker = inference_worker
+        self.evictions = 0
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def base_timeout(self, name: str) -> float:
+        """Configured idle timeout of a model."""
+        return float(self.per_model.get(name, self.timeout))
+
+    def timeout_for(self, name: str) -> float:
+        """
+        Idle timeout to apply to a model right now.
+
+        Args:
+            name: Catalog name of the model
+
+        Returns:
+            Seconds of inactivity after which the model is unloaded
+        """
+        base = self.base_timeout(name)
+        if not self.adaptive:
+            return base
+
+        gaps = self.cache.idle_gaps(name)
+        if len(gaps) < MIN_GAPS_FOR_ADAPTING:
+            return base
+
+        # Wait long enough to cover most observed returns, with some slack
+        candidate = float(np.percentile(gaps, 80)) * 1.25
+        ceiling = self.max_timeout if self.max_timeout is not None else base * 4
+        if candidate <= base or candidate > ceiling:
+            # Returns come quickly anyway, or so late that waiting would not help
+            return base
+        return candidate
+
+    def start(self) -> None:
+        """Start the reaper thread."""
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._run, name="model-reaper", daemon=True)
+        self._thread.start()
+        logger.debug("Model idle reaper started")
+
+    def stop(self) -> None:
+        """Stop the reaper thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def reap(self, now: Optional[float] = None) -> float:
+        """
+        Unload every model that has been idle past its timeout.
+
+        Args:
+            now: Current time, defaults to time.time()
+
+        Returns:
+            Seconds until the next model would become due
+        """
+        now = time.time() if now is None else now
+        next_due = MAX_WAKEUP_SECONDS
+        for name, last_used in self.cache.last_used().items():
+            timeout = self.timeout_for(name)
+            idle = now - last_used
+            if idle >= timeout:
+                if not self.cache.evict(name, last_used):
+                    continue
+                adapted = f", adapted from {self.base_timeout(name):.0f}s" if timeout != self.base_timeout(name) else ""
+                logger.info(f"Unloaded model {name} after {idle:.0f}s idle (timeout {timeout:.0f}s{adapted})")
+                self.evictions += 1
+            else:
+                next_due = min(next_due, timeout - idle)
+
+        worker = self.inference_worker
+        if worker is not None and worker.is_running:
+            idle = now - worker.last_used
+            if worker.stop_if_idle(self.timeout):
+                logger.info(f"Stopped inference worker after {idle:.0f}s idle (timeout {self.timeout:.0f}s)")
+                self.evictions += 1
+            else:
+                next_due = min(next_due, self.timeout - idle)
+        return next_due
+
+    def _run(self) -> None:
+        """Sleep until the next model is due, unload it, repeat."""
+        while not self._stop.is_set():
+            try:
+                wait = self.reap()
+            except Exception as e:
+                logger.error(f"Error unloading idle models: {e}")
+                wait = MAX_WAKEUP_SECONDS
+            self._stop.wait(min(MAX_WAKEUP_SECONDS, max(MIN_WAKEUP_SECONDS, wait)))
@@ -0,0 +1,139 @@
+#app/core/shared_audio.py
+
+import logging
+import os
+import secrets
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Tuple
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Segment names carry the owner's PID so stale ones can be attributed after a crash
+SEGMENT_PREFIX = "atx_"
+
+# Segments that could not be unmapped yet because views of them were still alive
+_deferred: List[shared_memory.SharedMemory] = []
+
+class AudioHandle(NamedTuple):
+    """Everything another process needs to map a slice of a recording without copying it.
+
+    kind is 'shm' (name is a shared memory segment) or 'file' (name is a spill file path).
+    """
+    kind: str
+    name: str
+    dtype: str
+    shape: Tuple[int, int]
+    start: int
+    stop: int
+    sample_rate: int
+
+def create_segment(nbytes: int) -> shared_memory.SharedMemory:
+    """
+    Create a shared memory segment owned by this process.
+
+    The segment is registered with multiprocessing's resource tracker, which
+    unlinks it if this process dies without releasing it.
+
+    Args:
+        nbytes: Size of the segment
+
+    Returns:
+        The new segment
+    """
+    name = f"{SEGMENT_PREFIX}{os.getpid()}_{secrets.token_hex(4)}"
+    return shared_memory.SharedMemory(name=name, create=True, size=max(1, nbytes))
+
+def release_segment(segment: shared_memory.SharedMemory) -> None:
+    """
+    Release a segment this process owns: unlink its name, then unmap it.
+
+    Unlinking first means no other process can attach any more and nothing
+    leaks even if unmapping has to wait for live views to be dropped.
+    """
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+    _close_or_defer(segment)
+    retry_deferred()
+
+def _close_or_defer(segment: shared_memory.SharedMemory) -> None:
+    """Unmap a segment, or remember it if numpy views still reference its memory."""
+    try:
+        segment.close()
+    except BufferError:
+        _deferred.append(segment)
+
+def retry_deferred() -> None:
+    """Unmap segments whose last views have since been dropped."""
+    pending = list(_deferred)
+    _deferred.clear()
+    for segment in pending:
+        _close_or_defer(segment)
+
+def cleanup_stale_segments() -> int:
+    """
+    Remove segments left by earlier runs whose owner no longer exists.
+
+    Only possible where segments are visible in /dev/shm; elsewhere the
+    resource tracker's cleanup on exit is relied upon.
+
+    Returns:
+        Number of segments removed
+    """
+    shm_dir = Path("/dev/shm")
+    if not shm_dir.is_dir():
+        return 0
+
+    removed = 0
+    for path in shm_dir.glob(f"{SEGMENT_PREFIX}*"):
+        try:
+            pid = int(path.name[len(SEGMENT_PREFIX):].split('_')[0])
+            os.kill(pid, 0)
+        except ValueError:
+            continue
+        except ProcessLookupError:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.error(f"Error removing stale segment {path.name}: {e}")
+        except PermissionError:
+            continue
+    if removed:
+        logger.info(f"Removed {removed} stale shared audio segment(s)")
+    return removed
+
+def attach(handle: AudioHandle) -> Tuple[np.ndarray, Callable[[], None]]:
+    """
+    Map the audio a handle refers to, from another process.
+
+    The attaching process never unlinks the segment; the owner does that once
+    the job's reply has arrived.
+
+    Args:
+        handle: Handle received with the job
+
+    Returns:
+        Tuple of (view of the referenced audio, function that unmaps it)
+    """
+    if handle.kind == 'file':
+        mapped = np.memmap(handle.name, dtype=handle.dtype, mode='r', shape=handle.shape)
+        return mapped[handle.start:handle.stop], lambda: None
+
+    segment = shared_memory.SharedMemory(name=handle.name)
+    count = handle.shape[0] * handle.shape[1]
+    data = np.frombuffer(segment.buf, dtype=handle.dtype, count=count).reshape(handle.shape)
+    view = data[handle.start:handle.stop]
+    del data
+
+    def detach() -> None:
+        try:
+            segment.close()
+        except BufferError:
+            logger.warning(f"Views of {handle.name} still alive, leaving it mapped")
+
+    return view, detach
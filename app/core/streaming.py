@@ -0,0 +1,254 @@
+#app/core/streaming.py
+
+import logging
+import re
+import time
+from queue import Queue
+from threading import Event, Lock, Thread
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+
+from app.core.dsp import prepare_for_model
+from app.core.vad import EnergyVAD
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# (start seconds, end seconds, word) on the recording's timeline
+Word = Tuple[float, float, str]
+
+def _normalize(word: str) -> str:
+    """Normalize a word for comparing hypotheses across passes."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+class StreamingTranscriber:
+    """Transcribe a recording in the background while it is still being captured.
+
+    Every `interval` seconds the audio after the last committed word is decoded
+    again. Words that two consecutive passes agree on are committed and never
+    decoded again, so when recording stops only the uncommitted tail is left.
+    """
+
+    def __init__(self, decode: Callable[..., list], get_audio: Callable[[], np.ndarray],
+                 sample_rate: int, interval: float = 2.0, window_seconds: float = 30.0,
+                 on_partial: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the streaming transcriber.
+
+        Args:
+            decode: Function taking a 16 kHz float32 array and keyword options, returning segments
+            get_audio: Function returning the audio captured so far
+            sample_rate: Sample rate of the captured audio
+            interval: Seconds between background passes
+            window_seconds: Longest stretch of uncommitted audio decoded in one pass
+            on_partial: Optional callback receiving committed plus tentative text after each pass
+        """
+        self.decode = decode
+        self.get_audio = get_audio
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.window_seconds = window_seconds
+        self.on_partial = on_partial
+
+        self.committed: List[Word] = []
+        self.committed_until: float = 0.0
+        self._hypothesis: List[Word] = []
+        self.passes: int = 0
+
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def committed_text(self) -> str:
+        """Text that is final and will not change."""
+        return ''.join(word for _, _, word in self.committed).strip()
+
+    def start(self) -> None:
+        """Start the background decoding thread."""
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.debug("Streaming transcription started")
+
+    def _run(self) -> None:
+        """Decode periodically until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self._pass()
+            except Exception as e:
+                logger.error(f"Error in streaming transcription pass: {e}")
+
+    def _decode_words(self, audio: np.ndarray, offset: float) -> List[Word]:
+        """Decode audio and return its words on the recording's timeline."""
+        # Whatever the decode profile, agreement needs word timings
+        segments = self.decode(audio, word_timestamps=True, without_timestamps=False)
+        return [(offset + w.start, offset + w.end, w.word)
+                for segment in segments for w in (segment.words or [])]
+
+    def _pass(self) -> None:
+        """Run one decode over the uncommitted audio and commit the stable prefix."""
+        with self._lock:
+            captured = self.get_audio()
+            end_time = len(captured) / self.sample_rate
+            if end_time - self.committed_until < 1.0:
+                return
+
+            start = int(self.committed_until * self.sample_rate)
+            stop = min(len(captured), start + int(self.window_seconds * self.sample_rate))
+            audio = prepare_for_model(captured[start:stop], self.sample_rate)
+            words = self._decode_words(audio, self.committed_until)
+            self.passes += 1
+
+            # Commit the prefix both passes agree on, keeping clear of the live edge
+            agreed = 0
+            for old, new in zip(self._hypothesis, words):
+                if _normalize(old[2]) != _normalize(new[2]) or new[1] > end_time - 1.0:
+                    break
+                agreed += 1
+
+            # Without agreement across a full window, force progress on the older half
+            if not agreed and stop - start >= int(self.window_seconds * self.sample_rate):
+                cutoff = self.committed_until + self.window_seconds / 2
+                agreed = sum(1 for w in words if w[1] <= cutoff)
+                if not words:
+                    self.committed_until = cutoff
+
+            if agreed:
+                self.committed.extend(words[:agreed])
+                self.committed_until = words[agreed - 1][1]
+            self._hypothesis = words[agreed:]
+
+        if self.on_partial:
+            tentative = ''.join(word for _, _, word in self._hypothesis)
+            self.on_partial((self.committed_text + tentative).strip())
+
+    def cancel(self) -> None:
+        """Stop background decoding without producing a result."""
+        self._stop.set()
+
+    def finish(self) -> str:
+        """
+        Stop background decoding and decode the remaining tail.
+
+        Returns:
+            Full transcription text
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            captured = self.get_audio()
+            start = int(self.committed_until * self.sample_rate)
+            tail_seconds = (len(captured) - start) / self.sample_rate
+            tail_text = ''
+            if tail_seconds > 0.1:
+                started = time.time()
+                audio = prepare_for_model(captured[start:], self.sample_rate)
+                segments = self.decode(audio)
+                tail_text = ' '.join(segment.text.strip() for segment in segments if segment.text.strip())
+                logger.info(f"Decoded {tail_seconds:.1f}s tail in {time.time() - started:.2f}s "
+                            f"after {self.passes} streaming passes "
+                            f"({self.committed_until:.1f}s already committed)")
+
+            return ' '.join(part for part in (self.committed_text, tail_text) if part)
+
+class PauseChunker:
+    """Transcribe completed utterances in the background whenever the speaker pauses.
+
+    The caller runs each captured block through an EnergyVAD. When a pause longer than
+    `pause_seconds` follows speech, the audio since the previous cut (up to
+    the middle of the pause) is queued for a background worker. At stop only
+    the last chunk still has to be decoded.
+    """
+
+    def __init__(self, decode: Callable[..., list], get_audio: Callable[[], np.ndarray],
+                 sample_rate: int, vad: EnergyVAD, pause_seconds: float = 0.7,
+                 min_chunk_seconds: float = 1.0):
+        """
+        Initialize the chunker.
+
+        Args:
+            decode: Function taking a 16 kHz float32 array, returning segments
+            get_audio: Function returning the audio captured so far
+            sample_rate: Sample rate of the captured audio
+            vad: Voice activity tracker the caller feeds with the same blocks as the buffer
+            pause_seconds: Silence that ends an utterance
+            min_chunk_seconds: Shortest chunk worth sending on its own
+        """
+        self.decode = decode
+        self.get_audio = get_audio
+        self.sample_rate = sample_rate
+        self.vad = vad
+        self.pause_seconds = pause_seconds
+        self.min_chunk_seconds = min_chunk_seconds
+
+        self._last_cut = 0
+        self._speech_since_cut = False
+        self._results: List[str] = []
+        self._jobs: Queue = Queue()
+        self._worker = Thread(target=self._work, daemon=True)
+        self._worker.start()
+
+    def _decode_text(self, audio: np.ndarray) -> str:
+        """Decode captured audio and return its text."""
+        segments = self.decode(prepare_for_model(audio, self.sample_rate))
+        return ' '.join(segment.text.strip() for segment in segments if segment.text.strip())
+
+    def _work(self) -> None:
+        """Decode queued chunks in order until the end marker arrives."""
+        while True:
+            audio = self._jobs.get()
+            if audio is None:
+                break
+            try:
+                started = time.time()
+                self._results.append(self._decode_text(audio))
+                logger.debug(f"Decoded {len(audio) / self.sample_rate:.1f}s chunk "
+                             f"in {time.time() - started:.2f}s while recording")
+            except Exception as e:
+                logger.error(f"Error decoding chunk: {e}")
+                self._results.append('')
+
+    def update(self, speech: np.ndarray) -> None:
+        """
+        Check for a pause after the VAD has processed a newly buffered block.
+
+        Args:
+            speech: Per-frame speech decisions returned by the VAD for that block
+        """
+        if speech.any():
+            self._speech_since_cut = True
+
+        if self._speech_since_cut and self.vad.trailing_silence >= self.pause_seconds:
+            captured = self.get_audio()
+            # Cut in the middle of the pause so neither side clips a word
+            cut = len(captured) - int(self.vad.trailing_silence / 2 * self.sample_rate)
+            if (cut - self._last_cut) / self.sample_rate >= self.min_chunk_seconds:
+                self._jobs.put(captured[self._last_cut:cut])
+                self._last_cut = cut
+                self._speech_since_cut = False
+
+    def cancel(self) -> None:
+        """Stop the worker after any chunk it is already decoding."""
+        self._jobs.put(None)
+
+    def finish(self) -> str:
+        """
+        Decode the last chunk and join it with the chunks committed during recording.
+
+        Returns:
+            Full transcription text
+        """
+        captured = self.get_audio()
+        queued = self._jobs.qsize()
+        self._jobs.put(None)
+        self._worker.join()
+
+        started = time.time()
+        tail_seconds = (len(captured) - self._last_cut) / self.sample_rate
+        tail_text = self._decode_text(captured[self._last_cut:]) if tail_seconds > 0.1 else ''
+        logger.info(f"Decoded {tail_seconds:.1f}s final chunk in {time.time() - started:.2f}s "
+                    f"after {len(self._results)} chunks ({queued} still queued at stop)")
+
+        return ' '.join(part for part in self._results + [tail_text] if part)
@@ -0,0 +1,167 @@
+#app/core/transcription_executor.py
+
+import logging
+from collections import deque
+from threading import BoundedSemaphore, Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# What to do with a new clip when the queue is full:
+# 'backpressure': accept it, callers should check is_full before starting another recording
+# 'drop_oldest': drop the oldest clip that has not started decoding
+# 'reject': drop the new clip
+QUEUE_POLICIES = ('backpressure', 'drop_oldest', 'reject')
+
+class TranscriptionJob:
+    """A queued transcription with its result callbacks."""
+
+    def __init__(self, seq: int, work: Callable[[], Any], on_result: Callable[[Any], None],
+                 on_dropped: Optional[Callable[[], None]] = None):
+        self.seq = seq
+        self.work = work
+        self.on_result = on_result
+        self.on_dropped = on_dropped
+
+class TranscriptionExecutor:
+    """Bounded pool of transcription workers that delivers results in submission order."""
+
+    def __init__(self, workers: int = 1, max_queued: int = 2, policy: str = 'backpressure'):
+        """
+        Initialize the executor and start its workers.
+
+        Args:
+            workers: Number of clips decoded at the same time
+            max_queued: Clips allowed to wait for a worker
+            policy: One of QUEUE_POLICIES, applied when the queue is full
+        """
+        if policy not in QUEUE_POLICIES:
+            logger.warning(f"Unknown queue policy {policy!r}, using 'backpressure'")
+            policy = 'backpressure'
+        self.max_queued = max(1, max_queued)
+        self.policy = policy
+
+        self._pending: Deque[TranscriptionJob] = deque()
+        self._condition = Condition()
+        self._shutdown = False
+        self._next_seq = 0
+        self._running = 0
+
+        # Finished jobs wait here until every earlier job has been delivered
+        self._delivery_lock = Lock()
+        self._finished: Dict[int, Tuple[TranscriptionJob, Any, bool]] = {}
+        self._next_delivery = 0
+        self.dropped = 0
+
+        # Held around every model decode, including the ones streaming and chunked
+        # recordings run on their own threads, so at most `workers` decode at once
+        self.decode_slots = BoundedSemaphore(max(1, workers))
+
+        self._workers: List[Thread] = []
+        for i in range(max(1, workers)):
+            worker = Thread(target=self._work, name=f"transcription-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        logger.debug(f"Transcription executor started with {len(self._workers)} worker(s)")
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the wait queue has reached its limit."""
+        with self._condition:
+            return len(self._pending) >= self.max_queued
+
+    @property
+    def busy(self) -> bool:
+        """Whether any clip is queued or being decoded."""
+        with self._condition:
+            return bool(self._pending) or self._running > 0
+
+    def submit(self, work: Callable[[], Any], on_result: Callable[[Any], None],
+               on_dropped: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Queue a transcription.
+
+        Args:
+            work: Function doing the transcription, run on a worker thread
+            on_result: Called with work's return value, in submission order
+            on_dropped: Called instead of on_result if the job is dropped by the queue policy
+
+        Returns:
+            False if the job was rejected
+        """
+        dropped_job = None
+        with self._condition:
+            rejected = self._shutdown or (len(self._pending) >= self.max_queued and self.policy == 'reject')
+            if not rejected and len(self._pending) >= self.max_queued:
+                if self.policy == 'drop_oldest':
+                    dropped_job = self._pending.popleft()
+                    logger.warning(f"Transcription queue full, dropping queued clip #{dropped_job.seq}")
+
+            if not rejected:
+                job = TranscriptionJob(self._next_seq, work, on_result, on_dropped)
+                self._next_seq += 1
+                self._pending.append(job)
+                self._condition.notify()
+
+        if rejected:
+            logger.warning("Transcription queue full or shut down, rejecting new clip")
+            self.dropped += 1
+            if on_dropped:
+                on_dropped()
+            return False
+        if dropped_job is not None:
+            self.dropped += 1
+            self._complete(dropped_job, None, dropped=True)
+        return True
+
+    def _work(self) -> None:
+        """Run queued jobs until shut down."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._shutdown:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                job = self._pending.popleft()
+                self._running += 1
+
+            try:
+                result = job.work()
+            except Exception as e:
+                logger.error(f"Error in transcription job #{job.seq}: {e}")
+                result = None
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._condition.notify_all()
+            self._complete(job, result)
+
+    def _complete(self, job: TranscriptionJob, result: Any, dropped: bool = False) -> None:
+        """Record a finished job and deliver every result that is now next in line."""
+        with self._delivery_lock:
+            self._finished[job.seq] = (job, result, dropped)
+            while self._next_delivery in self._finished:
+                ready, ready_result, ready_dropped = self._finished.pop(self._next_delivery)
+                self._next_delivery += 1
+                try:
+                    if ready_dropped:
+                        if ready.on_dropped:
+                            ready.on_dropped()
+                    else:
+                        ready.on_result(ready_result)
+                except Exception as e:
+                    logger.error(f"Error delivering transcription #{ready.seq}: {e}")
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting jobs and wait for the workers to finish what is queued.
+
+        Args:
+            timeout: Seconds to wait for each worker
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
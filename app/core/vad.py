@@ -0,0 +1,207 @@
+#app/core/vad.py
+
+import logging
+from typing import NamedTuple, Tuple
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Samples converted per step, bounds temporary memory on long (memory-mapped) clips
+_LEVEL_CHUNK = 1 << 20
+
+def frame_energies_db(audio: np.ndarray, frame_len: int) -> np.ndarray:
+    """
+    Compute the RMS level of consecutive frames in dBFS in one vectorized pass.
+
+    Args:
+        audio: 1-D audio, int16 or float in [-1, 1]
+        frame_len: Samples per frame; a trailing partial frame is ignored
+
+    Returns:
+        Array with one level per complete frame
+    """
+    n_frames = len(audio) // frame_len
+    power = np.empty(n_frames, dtype=np.float32)
+    frames_per_chunk = max(1, _LEVEL_CHUNK // frame_len)
+    for first in range(0, n_frames, frames_per_chunk):
+        last = min(first + frames_per_chunk, n_frames)
+        frames = audio[first * frame_len:last * frame_len].reshape(last - first, frame_len).astype(np.float32)
+        if audio.dtype == np.int16:
+            frames /= 32768.0
+        power[first:last] = np.einsum('ij,ij->i', frames, frames) / frame_len
+    return 10.0 * np.log10(power + 1e-10)
+
+def split_points(audio: np.ndarray, sample_rate: int, window_seconds: float,
+                 search_seconds: float = 10.0, frame_ms: float = 30.0) -> list:
+    """
+    Choose cut points that split a long clip into windows at its quietest moments.
+
+    Args:
+        audio: Audio shaped (frames,) or (frames, channels)
+        sample_rate: Sample rate of the audio
+        window_seconds: Longest window to produce
+        search_seconds: How far back from each window's end to look for a quiet frame
+        frame_ms: Analysis frame length in milliseconds
+
+    Returns:
+        Sample offsets of the cuts, excluding 0 and len(audio)
+    """
+    samples = audio[:, 0] if audio.ndim == 2 else audio
+    window = int(window_seconds * sample_rate)
+    search = min(int(search_seconds * sample_rate), window // 2)
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+
+    cuts = []
+    start = 0
+    while len(samples) - start > window:
+        region_start = start + window - search
+        levels = frame_energies_db(samples[region_start:start + window], frame_len)
+        cut = region_start + int(np.argmin(levels)) * frame_len + frame_len // 2 if len(levels) else start + window
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+class AudioLevels(NamedTuple):
+    """Summary levels of a clip."""
+    duration: float
+    rms_db: float
+    peak_db: float
+    voiced_ratio: float
+
+def measure_levels(audio: np.ndarray, sample_rate: int, frame_ms: float = 30.0,
+                   threshold_db: float = -45.0, margin_db: float = 9.0) -> AudioLevels:
+    """
+    Measure overall RMS, peak and the share of voiced frames of a clip.
+
+    Args:
+        audio: Audio shaped (frames,) or (frames, channels), int16 or float
+        sample_rate: Sample rate of the audio
+        frame_ms: Analysis frame length in milliseconds
+        threshold_db: Absolute level below which a frame is never voiced
+        margin_db: How far above the clip's noise floor a frame must be to count as voiced
+
+    Returns:
+        AudioLevels for the clip
+    """
+    samples = audio[:, 0] if audio.ndim == 2 else audio
+    if not len(samples):
+        return AudioLevels(0.0, -100.0, -100.0, 0.0)
+
+    scale = 32768.0 if samples.dtype == np.int16 else 1.0
+    peak = max(float(samples.max()), -float(samples.min())) / scale
+    levels = frame_energies_db(samples, max(1, int(sample_rate * frame_ms / 1000)))
+    if len(levels):
+        rms_db = float(10.0 * np.log10(np.mean(10.0 ** (levels / 10.0)) + 1e-10))
+        noise_floor = float(np.percentile(levels, 10))
+        voiced_ratio = float(np.mean(levels > max(threshold_db, noise_floor + margin_db)))
+    else:
+        rms_db, voiced_ratio = float(20.0 * np.log10(peak + 1e-5)), 0.0
+
+    peak_db = float(20.0 * np.log10(peak + 1e-5))
+    return AudioLevels(len(samples) / sample_rate, rms_db, peak_db, voiced_ratio)
+
+def trim_silence(audio: np.ndarray, sample_rate: int, guard_ms: float = 250.0, frame_ms: float = 30.0,
+                 threshold_db: float = -45.0, margin_db: float = 9.0) -> Tuple[np.ndarray, float, float]:
+    """
+    Cut leading and trailing silence from a clip, keeping a guard margin around the speech.
+
+    Args:
+        audio: Audio shaped (frames,) or (frames, channels), int16 or float
+        sample_rate: Sample rate of the audio
+        guard_ms: Audio kept before the first and after the last voiced frame
+        frame_ms: Analysis frame length in milliseconds
+        threshold_db: Absolute level below which a frame is never voiced
+        margin_db: How far above the clip's noise floor a frame must be to count as voiced
+
+    Returns:
+        Tuple of (trimmed view of audio, seconds removed at the start, seconds removed at the end)
+    """
+    samples = audio[:, 0] if audio.ndim == 2 else audio
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    levels = frame_energies_db(samples, frame_len)
+    if not len(levels):
+        return audio, 0.0, 0.0
+
+    noise_floor = float(np.percentile(levels, 10))
+    voiced = np.flatnonzero(levels > max(threshold_db, noise_floor + margin_db))
+    if not len(voiced):
+        # Nothing stands out; leave the decision to Whisper's own VAD
+        return audio, 0.0, 0.0
+
+    guard = int(sample_rate * guard_ms / 1000)
+    start = max(0, int(voiced[0]) * frame_len - guard)
+    end = min(len(samples), (int(voiced[-1]) + 1) * frame_len + guard)
+    return audio[start:end], start / sample_rate, (len(samples) - end) / sample_rate
+
+class EnergyVAD:
+    """Incremental energy-based voice activity tracker for captured blocks."""
+
+    def __init__(self, sample_rate: int, frame_ms: float = 30.0,
+                 threshold_db: float = -45.0, margin_db: float = 9.0):
+        """
+        Initialize the tracker.
+
+        Args:
+            sample_rate: Sample rate of the blocks fed to the tracker
+            frame_ms: Analysis frame length in milliseconds
+            threshold_db: Absolute level below which a frame is never speech
+            margin_db: How far above the tracked noise floor a frame must be to count as speech
+        """
+        self.sample_rate = sample_rate
+        self.frame_len = max(1, int(sample_rate * frame_ms / 1000))
+        self.frame_seconds = self.frame_len / sample_rate
+        self.threshold_db = threshold_db
+        self.margin_db = margin_db
+
+        # Noise floor follows quiet frames down immediately and drifts up slowly
+        self.noise_floor_db = threshold_db
+        self._floor_rise_db = 0.05
+        self._pending = np.empty(0, dtype=np.float32)
+
+        self.frames_processed = 0
+        self.speech_frames = 0
+        self.last_speech_frame = -1
+
+    @property
+    def speech_seen(self) -> bool:
+        """Whether any speech frame has been observed."""
+        return self.last_speech_frame >= 0
+
+    @property
+    def trailing_silence(self) -> float:
+        """Seconds of non-speech since the last speech frame (or since the start)."""
+        return (self.frames_processed - self.last_speech_frame - 1) * self.frame_seconds
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Classify the complete frames contained in a new block.
+
+        Args:
+            block: Audio block shaped (frames,) or (frames, channels)
+
+        Returns:
+            Boolean speech decision for each frame completed by this block
+        """
+        samples = block[:, 0] if block.ndim == 2 else block
+        if samples.dtype == np.int16:
+            samples = samples.astype(np.float32) / 32768.0
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+
+        levels = frame_energies_db(samples, self.frame_len)
+        consumed = len(levels) * self.frame_len
+        self._pending = samples[consumed:].astype(np.float32, copy=True)
+        if not len(levels):
+            return np.zeros(0, dtype=bool)
+
+        floor = min(self.noise_floor_db + self._floor_rise_db * len(levels), float(levels.min()))
+        self.noise_floor_db = max(floor, -100.0)
+        speech = levels > max(self.threshold_db, self.noise_floor_db + self.margin_db)
+
+        voiced = np.flatnonzero(speech)
+        if len(voiced):
+            self.last_speech_frame = self.frames_processed + int(voiced[-1])
+            self.speech_frames += len(voiced)
+        self.frames_processed += len(levels)
+        return speech
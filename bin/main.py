@@ -24,9 +24,11 @@ current_dir = Path(__file__).resolve().parent
 parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 
-# Import after path setup
-from bin import run_transcriber
-
 if __name__ == "__main__":
+    # Import after path setup, and only when run as a script: processes started
+    # by multiprocessing re-run this file as __mp_main__, and importing the app
+    # there would reset the log files and load the UI modules
+    from bin import run_transcriber
+    
     # Run the transcriber
     run_transcriber.main() 
\ No newline at end of file
@@ -8,6 +8,7 @@ import atexit
 from utils.logger import setup_logging
 from setup.setup_manager import SetupManager
 from app.models.model_manager import ModelManager
+from app.core.model_catalog import resolve_model
 from app.ui.menu_bar import main as run_app
 
 # Set up logging
@@ -39,7 +40,7 @@ def main():
         model_manager = ModelManager()
         
         # Check if we have a model selected and if it exists
-        exists, location = model_manager.check_model_location(model_manager.current_model)
+        exists, location = resolve_model(model_manager, model_manager.current_model)
         
         # If no model exists or none is selected, run setup
         if not exists:
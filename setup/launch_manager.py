@@ -94,14 +94,14 @@ class LaunchManager:
             logger.error(f"Error stopping process {pid}: {e}")
             self._cleanup_pid()
     
-    def launch(self, change_model: bool = False) -> None:
+    def launch(self, change_model: bool = False, calibrate: bool = False) -> None:
         """Launch the application."""
         # Check if already running
         if self.is_app_running():
             logger.info("Application is already running")
-            if change_model:
-                # Stop the running instance
-                logger.info("Stopping running instance to change model")
+            if change_model or calibrate:
+                # Stop the running instance, it only picks up new model settings on start
+                logger.info("Stopping running instance to change model settings")
                 self.stop_running_instance()
             else:
                 # Just exit
@@ -115,6 +115,9 @@ class LaunchManager:
             if not setup_manager.run_setup():
                 logger.error("Model change cancelled or failed")
                 return
+        elif calibrate:
+            from setup.setup_manager import SetupManager
+            SetupManager().run_calibration()
         
         # Launch the application
         self._start_app()
@@ -142,11 +145,13 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Launch the Audio Transcriber application")
     parser.add_argument("--change-model", action="store_true", help="Change the transcription model")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="Measure the fastest model settings for this computer")
     args = parser.parse_args()
     
     # Launch the application
     launch_manager = LaunchManager()
-    launch_manager.launch(change_model=args.change_model)
+    launch_manager.launch(change_model=args.change_model, calibrate=args.calibrate)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
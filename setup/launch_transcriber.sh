@@ -12,6 +12,9 @@ cd "$PARENT_DIR"
 if [ "$1" = "--change-model" ]; then
     echo "Starting model switcher..."
     python3 -m setup.launch_manager --change-model
+elif [ "$1" = "--calibrate" ]; then
+    echo "Starting calibration..."
+    python3 -m setup.launch_manager --calibrate
 else
     python3 -m setup.launch_manager
 fi 
\ No newline at end of file
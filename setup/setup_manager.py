@@ -1,6 +1,7 @@
 import logging
 from typing import Optional, Tuple
 from app.models.model_manager import ModelManager
+from app.core.model_catalog import check_disk_space, download, get_catalog, resolve_model
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -13,23 +14,27 @@ class SetupManager:
 
     def display_model_options(self):
         """Display available models with their characteristics."""
-        models = self.model_manager.get_available_models()
+        models = get_catalog(self.model_manager)
         
         print("\nAvailable models:")
-        print("-" * 60)
-        print(f"{'#':<3} {'Model':<8} {'Size':<8} {'Speed':<12} {'Accuracy':<10}")
-        print("-" * 60)
+        print("-" * 78)
+        print(f"{'#':<3} {'Model':<18} {'Size':<8} {'Speed':<12} {'vs large':<9} {'Accuracy':<10} {'Languages':<9}")
+        print("-" * 78)
         
         for idx, (model_name, info) in enumerate(models.items(), 1):
             size = f"{info['size_mb']}MB" if info['size_mb'] < 1000 else f"{info['size_mb']/1000:.1f}GB"
-            print(f"{idx:<3} {model_name:<8} {size:<8} {info['speed']:<12} {info['accuracy']:<10}")
+            relative = f"{info['relative_speed']:.1f}x"
+            languages = "English" if info['english_only'] else "All"
+            print(f"{idx:<3} {model_name:<18} {size:<8} {info['speed']:<12} {relative:<9} "
+                  f"{info['accuracy']:<10} {languages:<9}")
         
-        print("-" * 60)
+        print("-" * 78)
         print("Note: Larger models provide better accuracy but require more processing power and time.")
+        print("English-only (.en) and distilled models are faster for the same accuracy if you only speak English.")
 
     def get_user_model_choice(self) -> Optional[str]:
         """Get user's model choice and validate it."""
-        models = list(self.model_manager.get_available_models().keys())
+        models = list(get_catalog(self.model_manager).keys())
         
         while True:
             try:
@@ -58,10 +63,51 @@ class SetupManager:
             if progress_percent % 10 == 0:
                 print(".", end="", flush=True)
         
-        success, message = self.model_manager.download_model(model_name, progress_callback)
+        success, message = download(self.model_manager, model_name, progress_callback)
         print(f"\n{message}")
         return success, message
 
+    def run_calibration(self, model_name: Optional[str] = None) -> bool:
+        """Benchmark model settings on this computer and save the fastest ones."""
+        from app.common.settings import load_settings
+        from app.core.calibration import calibrate
+        
+        print("\nMeasuring the fastest model settings for this computer...")
+        print("Progress: ", end="", flush=True)
+        
+        def progress_callback(done, total):
+            """Display calibration progress."""
+            print(".", end="", flush=True)
+        
+        calibration = calibrate(
+            self.model_manager,
+            model_name,
+            concurrency=load_settings()['transcription_workers'],
+            progress_callback=progress_callback
+        )
+        if calibration is None:
+            print("\nCalibration failed, the default settings will be used.")
+            return False
+        
+        print(f"\nFastest settings: {calibration['compute_type']}, {calibration['cpu_threads']} threads, "
+              f"{calibration['num_workers']} worker(s) "
+              f"({calibration['real_time_factor']:.2f}s per second of audio)")
+        return True
+
+    def offer_calibration(self, model_name: str) -> None:
+        """Ask whether to benchmark model settings now."""
+        size_mb = get_catalog(self.model_manager).get(model_name, {}).get('size_mb', 0)
+        if size_mb < 500:
+            duration = "about a minute"
+        elif size_mb < 2000:
+            duration = "a few minutes"
+        else:
+            duration = "10 minutes or more"
+        choice = input("\nMeasure the fastest model settings for this computer now? "
+                       f"With the {model_name} model this takes {duration} (y/n): ")
+        if choice.strip().lower().startswith('y'):
+            self.run_calibration(model_name)
+
     def run_setup(self) -> bool:
         """Run the setup process to configure the application."""
         print("\n=== Audio Transcriber Setup ===")
@@ -77,13 +123,14 @@ class SetupManager:
             return False
         
         # Check if model already exists
-        if self.model_manager.check_model_exists(model_name):
+        if resolve_model(self.model_manager, model_name)[0]:
             print(f"\nModel {model_name} is already downloaded.")
             self.model_manager.set_active_model(model_name)
+            self.offer_calibration(model_name)
             return True
         
         # Check disk space
-        has_space, message = self.model_manager.check_disk_space(model_name)
+        has_space, message = check_disk_space(self.model_manager, model_name)
         if not has_space:
             print(f"\nError: {message}")
             return False
@@ -91,6 +138,7 @@ class SetupManager:
         # Download the model
         success, _ = self.handle_model_download(model_name)
         if success:
+            self.offer_calibration(model_name)
             print("\nSetup completed successfully!")
             return True
         else: